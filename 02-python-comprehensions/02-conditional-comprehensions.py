@@ -132,6 +132,123 @@ print(f"Comprehension: {comp_time:.4f}s")
 print(f"Speedup: {traditional_time/comp_time:.2f}x faster")
 
 
+# 🔗 Fused filter-map pipelines
+# Chaining comprehensions allocates a full list per stage. A lazy pipeline
+# records the stages and compiles them into ONE loop when it is built.
+class Pipeline:
+    """Lazy where/select/map/take chain compiled into a single loop"""
+
+    def __init__(self, source, stages=()):
+        self._source = source
+        self._stages = tuple(stages)
+        self._compiled = None
+
+    def where(self, predicate):
+        """Keep items where predicate(item) is true"""
+        return Pipeline(self._source, self._stages + (("where", predicate),))
+
+    def map(self, func):
+        """Transform each item with func(item)"""
+        return Pipeline(self._source, self._stages + (("map", func),))
+
+    def select(self, *fields, **computed):
+        """Project dict fields, optionally adding computed ones"""
+        if len(fields) == 1 and not computed:
+            field = fields[0]
+            return self.map(lambda item: item[field])
+        return self.map(lambda item: {
+            **{field: item[field] for field in fields},
+            **{name: func(item) for name, func in computed.items()}
+        })
+
+    def take(self, n):
+        """Let at most n items past this point of the chain"""
+        return Pipeline(self._source, self._stages + (("take", n),))
+
+    def _compile(self):
+        """Generate one generator function with every stage inlined"""
+        takes = [index for index, (kind, _) in enumerate(self._stages) if kind == "take"]
+        lines = ["def _run(source, *funcs):"]
+        for index in takes:
+            lines.append(f"    if funcs[{index}] <= 0: return")
+            lines.append(f"    count{index} = 0")
+        lines.append("    for item in source:")
+        for index, (kind, _) in enumerate(self._stages):
+            if kind == "where":
+                lines.append(f"        if not funcs[{index}](item): continue")
+            elif kind == "take":
+                lines.append(f"        if count{index} >= funcs[{index}]: return")
+                lines.append(f"        count{index} += 1")
+            else:
+                lines.append(f"        item = funcs[{index}](item)")
+        lines.append("        yield item")
+        for index in takes:
+            # A full take lets nothing else through: stop without pulling more
+            lines.append(f"        if count{index} >= funcs[{index}]: return")
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        return namespace["_run"]
+
+    def __iter__(self):
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled(self._source, *(func for _, func in self._stages))
+
+    def to_list(self):
+        """Materialize the results - the only allocation of a result list"""
+        return list(self)
+
+
+# Same filter + transform chain as the product examples above
+sale_labels = (
+    Pipeline(products)
+    .where(lambda p: p["category"] == "electronics")
+    .select("name", sale_price=lambda p: p["price"] * 0.8)
+    .map(lambda p: f"{p['name']}: ${p['sale_price']:.2f}")
+    .to_list()
+)
+print(f"Electronics sale labels: {sale_labels}")
+
+first_two = Pipeline(range(1, 11)).where(lambda n: n % 2 == 0).map(lambda n: n * 2).take(2)
+print(f"First two doubled evens: {first_two.to_list()}")
+odd = lambda n: n % 2 == 1
+print(f"take(3) then odd: {Pipeline(range(10)).take(3).where(odd).to_list()}, "
+      f"odd then take(3): {Pipeline(range(10)).where(odd).take(3).to_list()}")
+
+
+# 📊 Allocation comparison: chained comprehensions vs fused pipeline
+import tracemalloc
+
+catalog = [
+    {"name": f"Item{i}", "price": i % 1000, "category": "electronics" if i % 3 else "books"}
+    for i in range(100000)
+]
+
+tracemalloc.start()
+electronics = [p for p in catalog if p["category"] == "electronics"]
+priced = [{"name": p["name"], "sale_price": p["price"] * 0.8} for p in electronics]
+chained_labels = [f"{p['name']}: ${p['sale_price']:.2f}" for p in priced]
+chained_peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+del electronics, priced
+
+tracemalloc.start()
+fused_labels = (
+    Pipeline(catalog)
+    .where(lambda p: p["category"] == "electronics")
+    .select("name", sale_price=lambda p: p["price"] * 0.8)
+    .map(lambda p: f"{p['name']}: ${p['sale_price']:.2f}")
+    .to_list()
+)
+fused_peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+
+print(f"\nAllocation comparison ({len(catalog):,} products):")
+print(f"Chained comprehensions peak: {chained_peak / 1024 / 1024:.1f} MB")
+print(f"Fused pipeline peak: {fused_peak / 1024 / 1024:.1f} MB")
+print(f"Results equal: {chained_labels == fused_labels}")
+
+
 # 💡 When to use:
 # - Filtering and transforming data simultaneously
 # - Data cleaning and validation
@@ -106,6 +106,190 @@ colors = {"red": "#FF0000", "green": "#00FF00", "blue": "#0000FF"}
 hex_to_color = {hex_code: color for color, hex_code in colors.items()}
 print(f"Hex to color: {hex_to_color}")
 
+# Rescanning the source for every value is O(values × entries)
+shades = {"red": "#FF0000", "crimson": "#FF0000", "lime": "#00FF00", "green": "#00FF00"}
+rescanned = {
+    hex_code: [color for color, code in shades.items() if code == hex_code]
+    for hex_code in set(shades.values())
+}
+print(f"Rescanned inversion: {rescanned}")
+
+
+# 🗂️ Multi-valued inverted index (one pass, incremental, memory-mappable)
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+class InvertedIndex:
+    """Map each value to a compact array of the keys that hold it"""
+
+    MAGIC = b"INVIDX01"
+
+    def __init__(self):
+        self.keys = []        # key id -> key (None once removed)
+        self.key_ids = {}     # key -> key id
+        self.forward = {}     # key -> value, needed for incremental removal
+        self.postings = {}    # value -> array of key ids
+
+    @classmethod
+    def from_dict(cls, mapping):
+        """Build the index in a single pass over the forward mapping"""
+        index = cls()
+        for key, value in mapping.items():
+            index.add(key, value)
+        return index
+
+    def add(self, key, value):
+        """Insert or update one forward entry"""
+        if key in self.forward:
+            self.remove(key)
+        key_id = self.key_ids.get(key)
+        if key_id is None:
+            key_id = self.key_ids[key] = len(self.keys)
+            self.keys.append(key)
+        else:
+            self.keys[key_id] = key
+        self.forward[key] = value
+        self.postings.setdefault(value, array("q")).append(key_id)
+
+    def remove(self, key):
+        """Drop one forward entry"""
+        value = self.forward.pop(key)
+        key_id = self.key_ids[key]
+        ids = self.postings[value]
+        ids.remove(key_id)
+        if not ids:
+            del self.postings[value]
+        self.keys[key_id] = None
+
+    def get(self, value, default=None):
+        """Keys holding value"""
+        ids = self.postings.get(value)
+        if ids is None:
+            return default
+        return [self.keys[key_id] for key_id in ids]
+
+    def __getitem__(self, value):
+        return [self.keys[key_id] for key_id in self.postings[value]]
+
+    def __len__(self):
+        return len(self.postings)
+
+    def save(self, path):
+        """Write header (JSON) + one flat int64 postings block
+
+        Keys and values go through JSON, so they must be JSON scalars (str,
+        int, float, bool or None) to come back unchanged from load().
+        """
+        for kind, items in (("key", self.forward), ("value", self.postings)):
+            for item in items:
+                if not isinstance(item, _JSON_SCALARS):
+                    raise TypeError(f"cannot save {kind} {item!r}: only JSON scalars survive load()")
+        values, offsets, flat = [], [], array("q")
+        for value, ids in self.postings.items():
+            values.append(value)
+            offsets.append((len(flat), len(ids)))
+            flat.extend(ids)
+        header = json.dumps({"keys": self.keys, "values": values, "offsets": offsets}).encode()
+        header += b" " * (-len(header) % 8)  # keep the postings 8-byte aligned
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<q", len(header)))
+            f.write(header)
+            flat.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Reopen a saved index without rebuilding it"""
+        return MappedInvertedIndex(path)
+
+
+class MappedInvertedIndex:
+    """Read-only InvertedIndex whose postings stay in a memory-mapped file"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:8] != InvertedIndex.MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not an inverted index file")
+        (header_size,) = struct.unpack("<q", self._mm[8:16])
+        header = json.loads(self._mm[16:16 + header_size])
+        self.keys = header["keys"]
+        self._offsets = dict(zip(header["values"], map(tuple, header["offsets"])))
+        self._ids = memoryview(self._mm)[16 + header_size:].cast("q")
+
+    def get(self, value, default=None):
+        span = self._offsets.get(value)
+        if span is None:
+            return default
+        start, count = span
+        return [self.keys[key_id] for key_id in self._ids[start:start + count]]
+
+    def __getitem__(self, value):
+        start, count = self._offsets[value]
+        return [self.keys[key_id] for key_id in self._ids[start:start + count]]
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def close(self):
+        self._ids.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+color_index = InvertedIndex.from_dict(shades)
+print(f"Keys for #FF0000: {color_index['#FF0000']}")
+
+# Incremental updates as the forward dict changes
+color_index.add("scarlet", "#FF0000")
+color_index.add("lime", "#32CD32")  # value changed
+color_index.remove("green")
+print(f"After updates: {color_index.get('#FF0000')}, {color_index.get('#00FF00')}")
+
+# Persist once, reload later without rebuilding
+index_path = os.path.join(tempfile.gettempdir(), "color_index.bin")
+color_index.save(index_path)
+with InvertedIndex.load(index_path) as mapped_index:
+    print(f"Reloaded #32CD32: {mapped_index['#32CD32']}")
+os.remove(index_path)
+try:
+    InvertedIndex.from_dict({"point": (1, 2)}).save(index_path)
+except TypeError as error:
+    print(f"Not saved: {error}")
+
+# Rescan vs one-pass inversion
+import time
+
+big_mapping = {f"user{i}": f"group{i % 500}" for i in range(10000)}
+
+start = time.time()
+rescan_inverted = {
+    group: [user for user, g in big_mapping.items() if g == group]
+    for group in set(big_mapping.values())
+}
+rescan_time = time.time() - start
+
+start = time.time()
+big_index = InvertedIndex.from_dict(big_mapping)
+index_time = time.time() - start
+
+print(f"Rescan inversion: {rescan_time:.4f}s, one-pass index: {index_time:.4f}s")
+print(f"Results equal: {all(big_index[group] == users for group, users in rescan_inverted.items())}")
+
 
 # 📊 Grouping data
 students = [
@@ -133,6 +317,109 @@ for student in students:
 print(f"Subject counts: {subject_counts}")
 
 
+# 🏛️ Columnar grouping and counting
+# Convert records once into per-field columns. Categorical fields are
+# dictionary-encoded (value -> small int code), so grouping and counting
+# run over integer codes instead of per-record dict lookups.
+from collections import Counter
+
+
+def encode_column(records, field):
+    """Dictionary-encode one field -> (codes, categories), or None if missing"""
+    lookup = {}
+    codes = array("i")
+    append = codes.append
+    try:
+        for record in records:
+            value = record[field]
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(lookup)
+            append(code)
+    except KeyError:
+        return None  # field absent in some record: callers use the dict path
+    return codes, list(lookup)
+
+
+def load_columns(records, fields):
+    """Per-field encoded columns for a list of dict records"""
+    return {field: encode_column(records, field) for field in fields}
+
+
+def count_by(columns, records, field):
+    """Like the subject_counts loop, but over integer codes"""
+    column = columns.get(field)
+    if column is None:
+        # Same rule as group_by_column: records without the field are skipped
+        counts = {}
+        for record in records:
+            if field in record:
+                value = record[field]
+                counts[value] = counts.get(value, 0) + 1
+        return counts
+    codes, categories = column
+    return {categories[code]: count for code, count in Counter(codes).items()}
+
+
+def group_by_column(columns, records, key_field, value_field):
+    """Like the grade_groups loop, but keyed by integer codes"""
+    key_column, value_column = columns.get(key_field), columns.get(value_field)
+    if key_column is None or value_column is None:
+        groups = defaultdict(list)
+        for record in records:
+            if key_field in record and value_field in record:
+                groups[record[key_field]].append(record[value_field])
+        return dict(groups)
+    key_codes, key_categories = key_column
+    value_codes, value_categories = value_column
+    buckets = [[] for _ in key_categories]
+    for key_code, value_code in zip(key_codes, value_codes):
+        buckets[key_code].append(value_code)
+    return {
+        key_categories[code]: [value_categories[value] for value in bucket]
+        for code, bucket in enumerate(buckets)
+    }
+
+
+student_columns = load_columns(students, ["name", "grade", "subject"])
+print(f"Grade column: {student_columns['grade']}")
+print(f"Students by grade (columnar): {group_by_column(student_columns, students, 'grade', 'name')}")
+print(f"Subject counts (columnar): {count_by(student_columns, students, 'subject')}")
+
+# Missing field -> dict fallback
+partial = students + [{"name": "Eve", "grade": "B"}]
+partial_columns = load_columns(partial, ["grade", "subject"])
+print(f"Subject counts (with missing field): {count_by(partial_columns, partial, 'subject')}")
+
+# Row loops vs columnar codes
+
+export = [
+    {"name": f"Student{i}", "grade": "ABCDF"[i % 5], "subject": ("Math", "Science", "Art")[i % 3]}
+    for i in range(100000)
+]
+
+start = time.time()
+row_counts = {}
+for student in export:
+    row_counts[student["subject"]] = row_counts.get(student["subject"], 0) + 1
+row_groups = defaultdict(list)
+for student in export:
+    row_groups[student["grade"]].append(student["name"])
+row_time = time.time() - start
+
+start = time.time()
+export_columns = load_columns(export, ["name", "grade", "subject"])
+load_time = time.time() - start
+
+start = time.time()
+col_counts = count_by(export_columns, export, "subject")
+col_groups = group_by_column(export_columns, export, "grade", "name")
+col_time = time.time() - start
+
+print(f"Row loops: {row_time:.4f}s, columnar: {col_time:.4f}s (one-time load {load_time:.4f}s)")
+print(f"Results equal: {row_counts == col_counts and dict(row_groups) == col_groups}")
+
+
 # 🚀 Advanced patterns
 # Nested dictionary comprehension
 matrix = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
@@ -143,6 +430,239 @@ coord_dict = {
 }
 print(f"Coordinate dictionary: {coord_dict}")
 
+
+# 🧊 Sparse matrices: coord_dict-style access, compressed-row storage
+# Every (i, j) tuple key costs ~64 bytes before the value is even stored.
+# CSR keeps only the non-zeros: row offsets, column indices and values.
+from bisect import bisect_left
+
+
+class SparseMatrix:
+    """Compressed sparse row (CSR) matrix with (i, j) item access"""
+
+    def __init__(self, shape, indptr, indices, data):
+        self.shape = shape
+        self.indptr = indptr      # row i lives in indices/data[indptr[i]:indptr[i + 1]]
+        self.indices = indices    # column index of each stored value
+        self.data = data          # the non-zero values
+        self._transposed = None   # CSC copy built lazily for column slicing
+
+    @staticmethod
+    def _value_array(values):
+        values = list(values)
+        return array("q" if all(isinstance(v, int) for v in values) else "d", values)
+
+    @classmethod
+    def from_coord_dict(cls, coords, shape=None):
+        """Build from {(i, j): value}, dropping zeros"""
+        if shape is None:
+            shape = (max((i for i, _ in coords), default=-1) + 1,
+                     max((j for _, j in coords), default=-1) + 1)
+        for i, j in coords:
+            if not (0 <= i < shape[0] and 0 <= j < shape[1]):
+                raise IndexError(f"coordinate {(i, j)} is outside shape {shape}")
+        entries = sorted((key, value) for key, value in coords.items() if value != 0)
+        indptr = array("q", [0] * (shape[0] + 1))
+        for (i, _), _ in entries:
+            indptr[i + 1] += 1
+        for i in range(shape[0]):
+            indptr[i + 1] += indptr[i]
+        indices = array("q", (j for (_, j), _ in entries))
+        return cls(shape, indptr, indices, cls._value_array(value for _, value in entries))
+
+    @classmethod
+    def from_dense(cls, rows):
+        """Build from nested lists"""
+        indptr, indices, values = array("q", [0]), array("q"), []
+        for row in rows:
+            for j, value in enumerate(row):
+                if value != 0:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(indices))
+        shape = (len(rows), len(rows[0]) if rows else 0)
+        return cls(shape, indptr, indices, cls._value_array(values))
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def _normalize(self, index, axis):
+        """Python-style index check: negatives count from the end"""
+        size = self.shape[axis]
+        if not -size <= index < size:
+            raise IndexError(f"index {index} is out of bounds for axis {axis} with size {size}")
+        return index + size if index < 0 else index
+
+    def _axis_range(self, index, axis):
+        if isinstance(index, slice):
+            return range(*index.indices(self.shape[axis]))
+        index = self._normalize(index, axis)
+        return range(index, index + 1)
+
+    def __getitem__(self, key):
+        """m[i, j] -> value; any slice, e.g. m[1:3, :], -> SparseMatrix"""
+        i, j = key
+        if isinstance(i, slice) or isinstance(j, slice):
+            return self._submatrix(self._axis_range(i, 0), self._axis_range(j, 1))
+        i, j = self._normalize(i, 0), self._normalize(j, 1)
+        start, end = self.indptr[i], self.indptr[i + 1]
+        pos = bisect_left(self.indices, j, start, end)
+        if pos < end and self.indices[pos] == j:
+            return self.data[pos]
+        return 0
+
+    def _submatrix(self, rows, cols):
+        """CSR of the selected rows and columns (ranges, any step)"""
+        low, high = min(cols, default=0), max(cols, default=-1) + 1
+        indptr, indices, values = array("q", [0]), array("q"), []
+        for i in rows:
+            row_end = self.indptr[i + 1]
+            start = bisect_left(self.indices, low, self.indptr[i], row_end)
+            end = bisect_left(self.indices, high, start, row_end)
+            entries = [
+                (cols.index(self.indices[pos]), self.data[pos])
+                for pos in range(start, end)
+                if self.indices[pos] in cols
+            ]
+            if cols.step < 0:
+                entries.sort()
+            for j, value in entries:
+                indices.append(j)
+                values.append(value)
+            indptr.append(len(indices))
+        return SparseMatrix((len(rows), len(cols)), indptr, indices,
+                            array(self.data.typecode, values))
+
+    def row(self, i):
+        """Dense row i (O(row length))"""
+        i = self._normalize(i, 0)
+        result = [0] * self.shape[1]
+        for pos in range(self.indptr[i], self.indptr[i + 1]):
+            result[self.indices[pos]] = self.data[pos]
+        return result
+
+    def transpose(self):
+        """CSR of the transpose (i.e. this matrix in CSC form)"""
+        rows, cols = self.shape
+        counts = array("q", [0] * (cols + 1))
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(cols):
+            counts[j + 1] += counts[j]
+        indptr = array("q", counts)
+        indices = array("q", [0] * self.nnz)
+        data = array(self.data.typecode, [0] * self.nnz)
+        fill = array("q", counts[:-1])
+        for i in range(rows):
+            for pos in range(self.indptr[i], self.indptr[i + 1]):
+                target = fill[self.indices[pos]]
+                indices[target] = i
+                data[target] = self.data[pos]
+                fill[self.indices[pos]] += 1
+        return SparseMatrix((cols, rows), indptr, indices, data)
+
+    def col(self, j):
+        """Dense column j, served from a cached CSC copy"""
+        j = self._normalize(j, 1)
+        if self._transposed is None:
+            self._transposed = self.transpose()
+        return self._transposed.row(j)
+
+    def _elementwise(self, other, op, keep_missing):
+        """Merge two CSR matrices row by row (two-pointer walk)"""
+        if self.shape != other.shape:
+            raise ValueError(f"shape mismatch: {self.shape} vs {other.shape}")
+        indptr, indices, values = array("q", [0]), array("q"), []
+        for i in range(self.shape[0]):
+            a, a_end = self.indptr[i], self.indptr[i + 1]
+            b, b_end = other.indptr[i], other.indptr[i + 1]
+            while a < a_end or b < b_end:
+                col_a = self.indices[a] if a < a_end else None
+                col_b = other.indices[b] if b < b_end else None
+                if col_b is None or (col_a is not None and col_a < col_b):
+                    col, value = col_a, op(self.data[a], 0) if keep_missing else 0
+                    a += 1
+                elif col_a is None or col_b < col_a:
+                    col, value = col_b, op(0, other.data[b]) if keep_missing else 0
+                    b += 1
+                else:
+                    col, value = col_a, op(self.data[a], other.data[b])
+                    a += 1
+                    b += 1
+                if value != 0:
+                    indices.append(col)
+                    values.append(value)
+            indptr.append(len(indices))
+        return SparseMatrix(self.shape, indptr, indices, self._value_array(values))
+
+    def __add__(self, other):
+        return self._elementwise(other, lambda x, y: x + y, True)
+
+    def __sub__(self, other):
+        return self._elementwise(other, lambda x, y: x - y, True)
+
+    def __mul__(self, other):
+        if isinstance(other, SparseMatrix):
+            return self._elementwise(other, lambda x, y: x * y, False)
+        indptr, indices, values = array("q", [0]), array("q"), []
+        for i in range(self.shape[0]):
+            for pos in range(self.indptr[i], self.indptr[i + 1]):
+                value = self.data[pos] * other
+                if value != 0:  # e.g. m * 0 stores nothing
+                    indices.append(self.indices[pos])
+                    values.append(value)
+            indptr.append(len(indices))
+        return SparseMatrix(self.shape, indptr, indices, self._value_array(values))
+
+    __rmul__ = __mul__  # 2 * m; matrix * matrix is elementwise, so it commutes
+
+    def to_dense(self):
+        return [self.row(i) for i in range(self.shape[0])]
+
+    def to_coord_dict(self):
+        return {
+            (i, self.indices[pos]): self.data[pos]
+            for i in range(self.shape[0])
+            for pos in range(self.indptr[i], self.indptr[i + 1])
+        }
+
+    def nbytes(self):
+        return sum(arr.itemsize * len(arr) for arr in (self.indptr, self.indices, self.data))
+
+
+sparse = SparseMatrix.from_coord_dict(coord_dict)
+identity = SparseMatrix.from_dense([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+print(f"sparse[1, 2] = {sparse[1, 2]}, row 1: {sparse.row(1)}, column 2: {sparse.col(2)}")
+print(f"(sparse + identity) as dense: {(sparse + identity).to_dense()}")
+print(f"sparse * identity (elementwise): {(sparse * identity).to_coord_dict()}")
+print(f"sparse * 10 row 0: {(sparse * 10).row(0)}, 2 * sparse row 0: {(2 * sparse).row(0)}, "
+      f"(sparse * 0).nnz = {(sparse * 0).nnz}")
+try:
+    SparseMatrix.from_coord_dict({(-1, 0): 1})
+except IndexError as error:
+    print(f"Bad coordinate: {error}")
+print(f"sparse[-1, -1] = {sparse[-1, -1]}, sparse[0:2, 1:] = {sparse[0:2, 1:].to_dense()}")
+print(f"sparse[:, ::-1] = {sparse[:, ::-1].to_dense()}, sparse[1, :] = {sparse[1, :].to_dense()}")
+try:
+    sparse[3, 0]
+except IndexError as error:
+    print(f"Out of range: {error}")
+
+# Memory: tuple-keyed dict vs CSR on a 1%-dense 300 x 300 grid
+import sys
+
+grid = [[(i * 7 + j) % 50 if (i * 31 + j * 17) % 100 == 0 else 0 for j in range(300)]
+        for i in range(300)]
+grid_coords = {(i, j): grid[i][j] for i in range(len(grid)) for j in range(len(grid[i]))}
+dict_bytes = sys.getsizeof(grid_coords) + sum(
+    sys.getsizeof(key) + sys.getsizeof(value) for key, value in grid_coords.items()
+)
+grid_sparse = SparseMatrix.from_coord_dict(grid_coords)
+print(f"Tuple-keyed dict: {dict_bytes / 1024:.0f} KB, CSR ({grid_sparse.nnz} non-zeros): "
+      f"{grid_sparse.nbytes() / 1024:.1f} KB")
+print(f"Round trip equal: {grid_sparse.to_dense() == grid}")
+
 # Multiple data sources
 first_names = ["John", "Jane", "Bob"]
 last_names = ["Doe", "Smith", "Johnson"]
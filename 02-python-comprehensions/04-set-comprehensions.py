@@ -70,16 +70,14 @@ data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 2, 4, 6, 8]
 even_set = {num for num in data if num % 2 == 0}
 print(f"Unique even numbers: {even_set}")
 
-# Prime numbers (simple check)
-def is_prime(n):
-    if n < 2:
-        return False
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
-
-prime_set = {num for num in data if is_prime(num)}
+# Prime numbers (sieve once, then O(1) lookups)
+# Inline form of PrimeSieve in 08-multiple-conditions.py (snippets stay standalone)
+sieve_limit = max(data)
+sieve = bytearray([0, 0]) + b"\x01" * (sieve_limit - 1)  # sieve[n] == 1 <=> n is prime
+for p in range(2, int(sieve_limit**0.5) + 1):
+    if sieve[p]:
+        sieve[p * p::p] = bytes(len(range(p * p, sieve_limit + 1, p)))
+prime_set = {num for num in data if sieve[num]}
 print(f"Prime numbers: {prime_set}")
 
 
@@ -198,6 +196,256 @@ print(f"Set comprehension: {comp_time:.4f}s")
 print(f"Speedup: {traditional_time/comp_time:.2f}x faster")
 
 
+# 🧮 Compact integer sets (roaring-style compressed bitmaps)
+# Values are split into 2**16-wide chunks. Sparse chunks store a sorted
+# array of 16-bit offsets, dense chunks store an 8 KB bitmap (a Python int).
+from array import array
+from bisect import bisect_left
+
+_CHUNK_BITS = 16
+_CHUNK_MASK = (1 << _CHUNK_BITS) - 1
+_ARRAY_LIMIT = 4096  # above this, a bitmap is smaller than a uint16 array
+_BITMAP_BYTES = (1 << _CHUNK_BITS) // 8
+_FLAG_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def _pack_flags(flags):
+    """bytearray of 0/1 flags -> int bitmap (bit i set <=> flags[i] == 1)"""
+    return int(flags.translate(_FLAG_DIGITS)[::-1], 2)
+
+
+def _bitmap_offsets(bitmap):
+    """Yield the set bit positions of an int bitmap in ascending order"""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for index, byte in enumerate(data):
+        if byte:
+            base = index * 8
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+def _to_bitmap(container, bitmap=0):
+    """Int bitmap of container's offsets, OR-ed into bitmap"""
+    if isinstance(container, int):
+        return container | bitmap
+    data = bytearray(bitmap.to_bytes(_BITMAP_BYTES, "little"))
+    for offset in container:
+        data[offset >> 3] |= 1 << (offset & 7)
+    return int.from_bytes(data, "little")
+
+
+def _probe(offsets, bitmap, keep):
+    """Offsets whose bit in bitmap equals keep (array result, None if empty)"""
+    data = bitmap.to_bytes(_BITMAP_BYTES, "little")
+    result = array("H", [offset for offset in offsets
+                         if (data[offset >> 3] >> (offset & 7) & 1) == keep])
+    return result or None
+
+
+def _container_op(name, left, right):
+    """One chunk of a set operation, keeping sparse chunks sparse"""
+    set_op, int_op = _OPS[name]
+    left_array, right_array = not isinstance(left, int), not isinstance(right, int)
+    if left_array and right_array:
+        # Offset arrays merge via C-level set algebra; a bitmap is only built
+        # when the merged chunk grows past _ARRAY_LIMIT
+        merged = set_op(set(left), set(right))
+        return _from_offsets(merged) if merged else None
+    if name == "and" and (left_array or right_array):
+        return _probe(left, right, 1) if left_array else _probe(right, left, 1)
+    if name == "sub" and left_array:
+        return _probe(left, right, 0)
+    return _compress(int_op(_to_bitmap(left), _to_bitmap(right)))
+
+
+def _from_offsets(offsets):
+    """Container for one chunk's (unsorted, possibly repeated) offsets"""
+    unique = sorted(set(offsets))
+    if len(unique) <= _ARRAY_LIMIT:
+        return array("H", unique)
+    return _to_bitmap(unique)
+
+
+def _compress(bitmap):
+    """Pick the smaller container for a chunk (None if empty)"""
+    count = bitmap.bit_count()
+    if count == 0:
+        return None
+    if count <= _ARRAY_LIMIT:
+        return array("H", _bitmap_offsets(bitmap))
+    return bitmap
+
+
+_OPS = {
+    "or": (set.__or__, int.__or__),
+    "and": (set.__and__, int.__and__),
+    "sub": (set.__sub__, lambda a, b: a & ~b),
+    "xor": (set.__xor__, int.__xor__),
+}
+
+
+class IntSet:
+    """Set of non-negative ints stored as compressed bitmaps"""
+
+    def __init__(self, iterable=()):
+        chunks = {}  # high -> uint16 offsets, 2 bytes per value until packed
+        for value in iterable:
+            if value < 0:
+                raise ValueError(f"IntSet only holds non-negative ints, got {value}")
+            offsets = chunks.get(value >> _CHUNK_BITS)
+            if offsets is None:
+                offsets = chunks[value >> _CHUNK_BITS] = array("H")
+            offsets.append(value & _CHUNK_MASK)
+        self._chunks = {high: _from_offsets(offsets) for high, offsets in chunks.items()}
+
+    @classmethod
+    def from_range(cls, start, stop, step=1):
+        """Build like set(range(...)) without a per-element Python loop"""
+        if step < 1:
+            raise ValueError(f"IntSet.from_range needs a positive step, got {step}")
+        if start < 0 and start < stop:
+            raise ValueError(f"IntSet only holds non-negative ints, got start={start}")
+        result = cls()
+        value = start
+        while value < stop:
+            high = value >> _CHUNK_BITS
+            chunk_end = min(stop, (high + 1) << _CHUNK_BITS)
+            flags = bytearray(1 << _CHUNK_BITS)
+            low, end = value & _CHUNK_MASK, chunk_end - (high << _CHUNK_BITS)
+            flags[low:end:step] = b"\x01" * len(range(low, end, step))
+            result._chunks[high] = _compress(_pack_flags(flags))
+            value += len(range(value, chunk_end, step)) * step
+        return result
+
+    def __contains__(self, value):
+        container = self._chunks.get(value >> _CHUNK_BITS)
+        if container is None:
+            return False
+        low = value & _CHUNK_MASK
+        if isinstance(container, int):
+            return container >> low & 1 == 1
+        index = bisect_left(container, low)
+        return index < len(container) and container[index] == low
+
+    def __iter__(self):
+        for high in sorted(self._chunks):
+            base = high << _CHUNK_BITS
+            container = self._chunks[high]
+            offsets = _bitmap_offsets(container) if isinstance(container, int) else container
+            for low in offsets:
+                yield base | low
+
+    def __len__(self):
+        return sum(
+            container.bit_count() if isinstance(container, int) else len(container)
+            for container in self._chunks.values()
+        )
+
+    def _combine(self, other, name, keep_left, keep_right):
+        result = IntSet()
+        for high in self._chunks.keys() | other._chunks.keys():
+            left, right = self._chunks.get(high), other._chunks.get(high)
+            if right is None:
+                container = left if keep_left else None
+            elif left is None:
+                container = right if keep_right else None
+            else:
+                container = _container_op(name, left, right)
+            if container is not None:
+                result._chunks[high] = container
+        return result
+
+    def __or__(self, other):
+        return self._combine(other, "or", True, True)
+
+    def __and__(self, other):
+        return self._combine(other, "and", False, False)
+
+    def __sub__(self, other):
+        return self._combine(other, "sub", True, False)
+
+    def __xor__(self, other):
+        return self._combine(other, "xor", True, True)
+
+    def __eq__(self, other):
+        if isinstance(other, IntSet):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"IntSet({sorted(self)})" if len(self) <= 20 else f"IntSet(<{len(self)} ints>)"
+
+    def nbytes(self):
+        """Approximate payload size of all containers"""
+        return sum(
+            (container.bit_length() + 7) // 8 if isinstance(container, int)
+            else container.itemsize * len(container)
+            for container in self._chunks.values()
+        )
+
+
+# Same examples as above, as IntSets
+print(f"\nUnique evens (IntSet): {IntSet(num for num in data if num % 2 == 0)}")
+int_set1, int_set2 = IntSet(numbers1), IntSet(numbers2)
+print(f"Union: {int_set1 | int_set2}")
+print(f"Intersection: {int_set1 & int_set2}")
+print(f"Difference: {int_set1 - int_set2}, symmetric: {int_set1 ^ int_set2}")
+print(f"4 in set1: {4 in int_set1}, 9 in set1: {9 in int_set1}")
+
+# Sparse values: one array container per touched chunk
+sparse_ids = IntSet(i << _CHUNK_BITS | i for i in range(2000))
+print(f"2,000 sparse ids: {len(sparse_ids)} values in {sparse_ids.nbytes() / 1024:.1f} KB")
+
+
+# 📊 IntSet vs built-in set (memory and set-algebra speed)
+import sys
+
+size = 1000000
+evens = set(range(0, 2 * size, 2))
+threes = set(range(0, 2 * size, 3))
+int_evens = IntSet.from_range(0, 2 * size, 2)
+int_threes = IntSet.from_range(0, 2 * size, 3)
+
+# set: hash table + one int object per element; IntSet: container payloads
+set_memory = sum(sys.getsizeof(s) + sum(map(sys.getsizeof, s)) for s in (evens, threes))
+intset_memory = int_evens.nbytes() + int_threes.nbytes()
+
+start = time.time()
+set_union, set_common = evens | threes, evens & threes
+set_ops_time = time.time() - start
+
+start = time.time()
+int_union, int_common = int_evens | int_threes, int_evens & int_threes
+intset_ops_time = time.time() - start
+
+print(f"\nIntSet vs set ({len(evens):,} + {len(threes):,} elements):")
+print(f"set memory: {set_memory / 1024 / 1024:.1f} MB, IntSet memory: {intset_memory / 1024:.0f} KB")
+print(f"set |, &: {set_ops_time:.4f}s, IntSet |, &: {intset_ops_time:.4f}s")
+print(f"Same sizes: {len(set_union) == len(int_union) and len(set_common) == len(int_common)}")
+del evens, threes, set_union, set_common
+
+# Sparse sets: array containers are merged without building bitmaps
+import random
+
+rng = random.Random(42)
+sparse_a = set(rng.sample(range(2 * size), 3000))
+sparse_b = set(rng.sample(range(2 * size), 3000))
+int_sparse_a, int_sparse_b = IntSet(sparse_a), IntSet(sparse_b)
+
+start = time.time()
+sparse_union, sparse_common = sparse_a | sparse_b, sparse_a & sparse_b
+set_sparse_time = time.time() - start
+
+start = time.time()
+int_sparse_union, int_sparse_common = int_sparse_a | int_sparse_b, int_sparse_a & int_sparse_b
+intset_sparse_time = time.time() - start
+
+print(f"Sparse ({len(sparse_a):,} + {len(sparse_b):,} elements): set |, & {set_sparse_time:.4f}s, "
+      f"IntSet |, & {intset_sparse_time:.4f}s, same: "
+      f"{list(int_sparse_union) == sorted(sparse_union) and list(int_sparse_common) == sorted(sparse_common)}")
+
+
 # 💡 When to use:
 # - Removing duplicates with transformation
 # - Mathematical set operations
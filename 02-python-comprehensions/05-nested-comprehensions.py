@@ -64,6 +64,131 @@ dept_skill_pairs = [
 print(f"Department-skill pairs: {dept_skill_pairs[:5]}...")  # Show first 5
 
 
+# 🧭 Compiled path queries for nested JSON
+# Instead of hand-writing a nested comprehension per JSON shape, compile a
+# path like "employees[*].skills[*]" once into a specialized generator.
+import itertools
+import json
+import re
+
+_PATH_STEP = re.compile(r"(?:^|\.)([A-Za-z_][\w-]*)|\[(\*|-?\d+)\]")
+
+
+def compile_path(path):
+    """Compile "a.b[*].c[0]" into a generator function doc -> values"""
+    lines, var, indent = ["def _extract(doc):"], "doc", "    "
+    pos, depth = 0, 0
+    while pos < len(path):
+        step = _PATH_STEP.match(path, pos)
+        if step is None or step.group().startswith(".") and pos == 0:
+            raise ValueError(f"Invalid path {path!r} at position {pos}")
+        pos = step.end()
+        key, index = step.groups()
+        if key is not None:
+            lines.append(f"{indent}v{depth} = {var}[{key!r}]")
+        elif index == "*":
+            lines.append(f"{indent}for v{depth} in {var}:")
+            indent += "    "
+        else:
+            lines.append(f"{indent}v{depth} = {var}[{int(index)}]")
+        var = f"v{depth}"
+        depth += 1
+    lines.append(f"{indent}yield {var}")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_extract"]
+
+
+def join_paths(base, *paths):
+    """Cross-product of several sub-paths, evaluated per item of base"""
+    base_extract = compile_path(base)
+    extractors = [compile_path(path) for path in paths]
+
+    def _join(doc):
+        for item in base_extract(doc):
+            yield from itertools.product(*(list(extract(item)) for extract in extractors))
+    return _join
+
+
+def iter_json_array(filename, chunk_size=1 << 16):
+    """Stream the elements of a top-level JSON array without loading it all"""
+    decoder = json.JSONDecoder()
+    skip = re.compile(r"[\s,]*")
+    with open(filename, encoding="utf-8") as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"{filename} does not contain a JSON array")
+        pos, eof = 1, False
+        while True:
+            pos = skip.match(buffer, pos).end()
+            if buffer.startswith("]", pos):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                # A number cut at the chunk edge ("3." of "3.25") still decodes,
+                # so only trust items followed by a delimiter
+                complete = eof or (end < len(buffer) and buffer[end] in " \t\r\n,]")
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if complete:
+                yield item
+                pos = end
+                continue
+            more = f.read(chunk_size)
+            eof = not more
+            buffer, pos = buffer[pos:] + more, 0
+
+
+company = {"employees": employees}
+all_skills_path = compile_path("employees[*].skills[*]")
+dept_skill_join = join_paths("employees[*]", "departments[*]", "skills[*]")
+print(f"Path all_skills matches: {list(all_skills_path(company)) == all_skills}")
+print(f"Path dept_skill_pairs matches: {list(dept_skill_join(company)) == dept_skill_pairs}")
+print(f"First employee's first skill: {next(compile_path('employees[0].skills[0]')(company))}")
+nested_doc = {"a": {"b": [{"c": [1, 2]}, {"c": [3]}]}, "ab": "wrong key"}
+print(f"Plain a.b path: {next(compile_path('a.b')(nested_doc))}")
+print(f"a.b[*].c[0] path: {list(compile_path('a.b[*].c[0]')(nested_doc))}")
+
+# Streaming a large employee export vs json.load + comprehension
+import os
+import tempfile
+import time
+import tracemalloc
+
+export_path = os.path.join(tempfile.gettempdir(), "employees_export.json")
+with open(export_path, "w", encoding="utf-8") as f:
+    json.dump([
+        {"name": f"Emp{i}", "departments": ["Engineering", "Research"][: 1 + i % 2],
+         "skills": ["Python", "SQL", "Docker", "Excel"][: 1 + i % 4]}
+        for i in range(20000)
+    ], f)
+
+tracemalloc.start()
+start = time.time()
+with open(export_path, encoding="utf-8") as f:
+    loaded = json.load(f)
+loaded_skills = [skill for employee in loaded for skill in employee["skills"]]
+load_time = time.time() - start
+load_peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+del loaded
+
+skills_of = compile_path("skills[*]")
+tracemalloc.start()
+start = time.time()
+streamed_skills = [skill for employee in iter_json_array(export_path) for skill in skills_of(employee)]
+stream_time = time.time() - start
+stream_peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+os.remove(export_path)
+
+print(f"json.load + comprehension: {load_time:.4f}s, peak {load_peak / 1024 / 1024:.1f} MB")
+print(f"Streamed compiled path: {stream_time:.4f}s, peak {stream_peak / 1024 / 1024:.1f} MB")
+print(f"Results equal: {loaded_skills == streamed_skills}")
+
+
 # 🔢 Matrix operations
 # Create a multiplication table
 multiplication_table = [
@@ -177,6 +302,123 @@ combinations = [
 print(f"Word combinations (first 5): {combinations[:5]}")
 
 
+# 🌳 Lazy Cartesian products with constraint pushdown
+# Filtering after the full product visits every combination. Attaching each
+# constraint to the deepest dimension it mentions prunes whole sub-trees,
+# and memoized sub-tree counts give len() and indexing without enumeration.
+import inspect
+import math
+
+
+class LazyProduct:
+    """Cartesian product of named dimensions with early-pruned constraints"""
+
+    def __init__(self, **dimensions):
+        self.names = list(dimensions)
+        self.values = [list(values) for values in dimensions.values()]
+        self.checks = [[] for _ in self.names]  # constraints evaluated at each level
+        self._memo = None
+
+    def where(self, predicate):
+        """Add a constraint; its parameter names pick the dimensions it sees"""
+        params = list(inspect.signature(predicate).parameters)
+        unknown = [name for name in params if name not in self.names]
+        if not params or unknown:
+            problem = f"unknown parameters {unknown}" if unknown else "no parameters"
+            raise ValueError(f"where() predicate has {problem}; name its parameters "
+                             f"after the dimensions: {', '.join(self.names)}")
+        positions = [self.names.index(name) for name in params]
+        self.checks[max(positions)].append((predicate, params))
+        self._memo = None
+        return self
+
+    def _passes(self, level, chosen):
+        bound = dict(zip(self.names, chosen))
+        return all(
+            predicate(*(bound[name] for name in params))
+            for predicate, params in self.checks[level]
+        )
+
+    def _prepare(self):
+        """For each level, which earlier choices can still affect the sub-tree"""
+        depth = len(self.names)
+        self._needed = []
+        for level in range(depth + 1):
+            later = {self.names.index(name)
+                     for checks in self.checks[level:] for _, params in checks for name in params}
+            self._needed.append(sorted(index for index in later if index < level))
+        self._memo = [{} for _ in range(depth + 1)]
+
+    def _count(self, level, chosen):
+        if self._memo is None:
+            self._prepare()
+        if level == len(self.names):
+            return 1
+        if not self._needed[level] and not any(self.checks[level:]):
+            return math.prod(len(values) for values in self.values[level:])
+        key = tuple(chosen[index] for index in self._needed[level])
+        memo = self._memo[level]
+        if key not in memo:
+            total = 0
+            for value in self.values[level]:
+                chosen.append(value)
+                if self._passes(level, chosen):
+                    total += self._count(level + 1, chosen)
+                chosen.pop()
+            memo[key] = total
+        return memo[key]
+
+    def __len__(self):
+        return self._count(0, [])
+
+    def __iter__(self):
+        def walk(level, chosen):
+            if level == len(self.names):
+                yield dict(zip(self.names, chosen))
+                return
+            for value in self.values[level]:
+                chosen.append(value)
+                if self._passes(level, chosen):
+                    yield from walk(level + 1, chosen)
+                chosen.pop()
+        return walk(0, [])
+
+    def __getitem__(self, index):
+        """The index-th valid combination, in iteration order"""
+        total = len(self)
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError("LazyProduct index out of range")
+        chosen = []
+        for level in range(len(self.names)):
+            for value in self.values[level]:
+                chosen.append(value)
+                if self._passes(level, chosen):
+                    size = self._count(level + 1, chosen)
+                    if index < size:
+                        break
+                    index -= size
+                chosen.pop()
+        return dict(zip(self.names, chosen))
+
+
+lazy_variants = LazyProduct(color=colors, size=sizes, style=styles).where(
+    lambda color, style: not (color == "red" and style == "formal")
+)
+print(f"Lazy variants: {len(lazy_variants)} total, matches eager: "
+      f"{list(lazy_variants) == product_variants}")
+print(f"Variant #7 without enumerating: {lazy_variants[7]}")
+
+# A 12-dimension SKU space: 6**12 ≈ 2.2 billion raw combinations
+sku_space = LazyProduct(**{f"d{k}": range(6) for k in range(12)})
+sku_space.where(lambda d0, d1: d0 != d1)
+sku_space.where(lambda d3, d7: (d3 + d7) % 3 != 0)
+sku_space.where(lambda d10, d11: d10 <= d11)
+print(f"Valid SKUs: {len(sku_space):,} of {6 ** 12:,}")
+print(f"SKU #500,000,000: {sku_space[500000000]}")
+
+
 # 📈 Performance considerations
 import time
 
@@ -202,6 +444,175 @@ print(f"Nested comprehension: {comp_time:.4f}s")
 print(f"Speedup: {traditional_time/comp_time:.2f}x faster")
 
 
+# 🧱 Dense 2D grids in one contiguous buffer
+# A list of lists is one object per cell plus one list per row. A grid keeps
+# every cell in a single buffer: a NumPy array when available, otherwise an
+# array.array filled in row blocks by C-level map() calls.
+import operator
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_UFUNCS = {} if np is None else {operator.mul: np.multiply, operator.add: np.add,
+                                 operator.sub: np.subtract, pow: np.power}
+
+
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+_EXACT_FLOAT_INT = 2**53  # larger ints lose precision as floats
+
+
+def _typecode(values):
+    """Narrowest array typecode holding every value exactly, None for a list"""
+    kinds = set(map(type, values))
+    if kinds <= {int, bool}:
+        if not values or _INT64_MIN <= min(values) and max(values) <= _INT64_MAX:
+            return "q"
+    elif kinds <= {int, bool, float}:
+        if all(abs(value) <= _EXACT_FLOAT_INT for value in values if type(value) is not float):
+            return "d"  # ints mixed with floats are promoted, as NumPy does
+    return None
+
+
+def _pack(values, buffer=None):
+    """Pack values (appended to buffer) into array('q'/'d'), else a list"""
+    code = _typecode(values)
+    if buffer is None:
+        return list(values) if code is None else array(code, values)
+    if isinstance(buffer, list):
+        buffer.extend(values)
+        return buffer
+    if buffer.typecode == code:
+        buffer.extend(values)
+        return buffer
+    return _pack(buffer.tolist() + values)  # widen q -> d -> list
+
+
+def _buffer(values):
+    """int64/float64 ndarray when NumPy can hold values exactly, else _pack()"""
+    code = _typecode(values)
+    if np is None or code is None:
+        return _pack(values)
+    return np.array(values, dtype=np.int64 if code == "q" else np.float64)
+
+
+def _outer_fits_int64(op, row_values, col_values):
+    """True when op over these ints cannot leave the int64 range"""
+    a = max(map(abs, row_values), default=0)
+    b = max(map(abs, col_values), default=0)
+    if op is pow:
+        return min(col_values, default=0) >= 0 and (a <= 1 or a.bit_length() * b <= 62)
+    return (a * b if op is operator.mul else a + b) <= _INT64_MAX
+
+
+class Grid:
+    """Row-major 2D array backed by one contiguous buffer"""
+
+    def __init__(self, rows, cols, buffer):
+        self.rows, self.cols = rows, cols
+        self.buffer = buffer
+
+    @classmethod
+    def outer(cls, row_values, col_values, op=operator.mul, block_rows=64):
+        """Grid[i][j] = op(row_values[i], col_values[j]), e.g. i * j tables"""
+        row_values, col_values = list(row_values), list(col_values)
+        rows, cols = len(row_values), len(col_values)
+        ufunc = _UFUNCS.get(op)
+        code = _typecode(row_values + col_values) if ufunc is not None else None
+        if code == "q" and _outer_fits_int64(op, row_values, col_values) or code == "d" and op is not pow:
+            dtype = np.int64 if code == "q" else np.float64
+            result = ufunc.outer(np.array(row_values, dtype=dtype), np.array(col_values, dtype=dtype))
+            return cls(rows, cols, result.ravel())
+        # Anything NumPy would wrap around or reject: exact Python values
+        buffer = None
+        for block_start in range(0, rows, block_rows):
+            block = []
+            for value in row_values[block_start:block_start + block_rows]:
+                block.extend(map(op, repeat(value, cols), col_values))
+            buffer = _pack(block, buffer)
+        return cls(rows, cols, buffer if buffer is not None else array("q"))
+
+    @classmethod
+    def from_rows(cls, nested):
+        """Copy a list of lists into a grid"""
+        flat = [value for row in nested for value in row]
+        buffer = _buffer(flat)
+        return cls(len(nested), len(nested[0]) if nested else 0, buffer)
+
+    def map(self, func):
+        """Elementwise func; a NumPy buffer is passed whole when func allows it"""
+        if np is not None and isinstance(self.buffer, np.ndarray):
+            try:
+                result = np.asarray(func(self.buffer))
+            except (TypeError, ValueError):  # e.g. `if x` on an array
+                result = None
+            if result is not None and result.shape == self.buffer.shape and (
+                    result.dtype.kind not in "iu" or self._int64_safe(func)):
+                return Grid(self.rows, self.cols, result)
+            return Grid(self.rows, self.cols, _buffer([func(x) for x in self.buffer.tolist()]))
+        return Grid(self.rows, self.cols, _pack(list(map(func, self.buffer))))
+
+    def _int64_safe(self, func):
+        """Re-run func in float64: int64 results are trusted only far from wrapping"""
+        try:
+            estimate = np.asarray(func(self.buffer.astype(np.float64)), dtype=np.float64)
+        except (TypeError, ValueError):
+            return False
+        return estimate.shape == self.buffer.shape and bool(np.all(np.abs(estimate) < 2.0**62))
+
+    def flatten(self):
+        """Row-major values as a list (the buffer itself is already flat)"""
+        return list(self.buffer) if isinstance(self.buffer, list) else self.buffer.tolist()
+
+    def to_rows(self):
+        flat = self.flatten()
+        return [flat[i * self.cols:(i + 1) * self.cols] for i in range(self.rows)]
+
+    def __getitem__(self, key):
+        i, j = key
+        return self.buffer[i * self.cols + j]
+
+
+table = Grid.outer(range(1, 6), range(1, 6))
+print(f"Grid multiplication table matches: {table.to_rows() == multiplication_table}")
+print(f"table[3, 4] = {table[3, 4]}, doubled row 0: {table.map(lambda x: x * 2).to_rows()[0]}")
+print(f"Mixed int/float outer: {Grid.outer([1, 1.5], [1, 2]).to_rows()}")
+print(f"Halved with a branch: {table.map(lambda x: x / 2 if x > 4 else 0).to_rows()[0]}")
+print(f"Beyond 64-bit ints: {Grid.outer([2**40, 1], [2**30, 1]).to_rows()}")
+print(f"Scaled past int64: {table.map(lambda x: x * 2**62).to_rows()[0][:2]}")
+print(f"Non-numeric outer: {Grid.outer(['a', 'b'], [1, 2]).to_rows()}")
+
+import sys
+
+print(f"\nGrid vs nested comprehensions ({'NumPy' if np is not None else 'array.array'} backend):")
+for size in (100, 300, 600):
+    start = time.time()
+    nested = [[i * j for j in range(size)] for i in range(size)]
+    nested_build = time.time() - start
+    start = time.time()
+    doubled = [item * 2 for row in nested for item in row]
+    nested_map = time.time() - start
+    nested_bytes = sys.getsizeof(nested) + sum(
+        sys.getsizeof(row) + sum(map(sys.getsizeof, row)) for row in nested
+    )
+
+    start = time.time()
+    grid = Grid.outer(range(size), range(size))
+    grid_build = time.time() - start
+    start = time.time()
+    grid_doubled = grid.map(lambda x: x * 2)
+    grid_map = time.time() - start
+    grid_bytes = grid.buffer.itemsize * len(grid.buffer)
+
+    print(f"{size}x{size}: build {nested_build:.4f}s vs {grid_build:.4f}s, "
+          f"double {nested_map:.4f}s vs {grid_map:.4f}s, "
+          f"memory {nested_bytes / 1024:.0f} KB vs {grid_bytes / 1024:.0f} KB, "
+          f"equal: {doubled == grid_doubled.flatten()}")
+
+
 # 🔄 Readable vs. complex nested comprehensions
 # Good: Simple and readable
 simple_nested = [
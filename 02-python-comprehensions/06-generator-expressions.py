@@ -40,13 +40,9 @@ print(f"Results are equal: {squared_list == squared_from_gen}")
 # 🎯 Real-world example: Processing large files
 def process_log_file(filename):
     """Process log file line by line without loading everything into memory"""
-    # Generator expression for memory efficiency
-    error_lines = (
-        line.strip()
-        for line in open(filename, 'r', encoding='utf-8')
-        if 'ERROR' in line
-    )
-    return error_lines
+    # The with block closes the file once the generator is exhausted or closed
+    with open(filename, 'r', encoding='utf-8') as f:
+        yield from (line.strip() for line in f if 'ERROR' in line)
 
 # Create sample log file
 sample_log = """INFO: Application started
@@ -68,10 +64,179 @@ print(f"Error lines generator: {error_generator}")
 for error in error_generator:
     print(f"Found error: {error}")
 
-# Clean up
+
+# 🗺️ mmap-backed log scanning
+# Search raw bytes in a memory-mapped file and only decode the lines that match
+import mmap
 import os
+import re
+
+
+class LogScanner:
+    """Yield matching log lines using mmap + bytes.find (or one compiled regex)"""
+
+    def __init__(self, filename, *patterns, encoding='utf-8'):
+        self.filename = filename
+        self.patterns = [p.encode(encoding) if isinstance(p, str) else p for p in patterns]
+        if not self.patterns or not all(self.patterns):
+            raise ValueError("LogScanner needs at least one non-empty pattern")
+        self.encoding = encoding
+        # Several patterns -> one precompiled alternation, still a single pass
+        self._regex = (
+            re.compile(b"|".join(map(re.escape, self.patterns))) if len(self.patterns) > 1 else None
+        )
+        self._file = self._map = None
+
+    def __enter__(self):
+        self._file = open(self.filename, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _find(self, data, pos, end):
+        if self._regex is not None:
+            match = self._regex.search(data, pos, end)
+            return match.start() if match else -1
+        return data.find(self.patterns[0], pos, end)
+
+    def lines(self, start=0, end=None):
+        """Matching lines (stripped str) between byte offsets start and end"""
+        data = self._map
+        if data is None:
+            return
+        end = len(data) if end is None else end
+        pos = start
+        while True:
+            hit = self._find(data, pos, end)
+            if hit == -1:
+                return
+            line_start = data.rfind(b"\n", 0, hit) + 1
+            line_end = data.find(b"\n", hit)
+            if line_end == -1:
+                line_end = len(data)
+            yield data[line_start:line_end].decode(self.encoding).strip()
+            pos = line_end + 1
+
+
+def scan_log(filename, *patterns):
+    """Generator wrapper: the file is unmapped and closed as soon as it ends"""
+    with LogScanner(filename, *patterns) as scanner:
+        yield from scanner.lines()
+
+
+print(f"mmap errors: {list(scan_log('sample.log', 'ERROR'))}")
+print(f"Errors or retries: {list(scan_log('sample.log', 'ERROR', 'Retrying'))}")
+
+# Clean up
 os.remove('sample.log')
 
+# Benchmark on a generated log (1% error lines)
+import tempfile
+
+big_log = os.path.join(tempfile.gettempdir(), 'benchmark.log')
+with open(big_log, 'w', encoding='utf-8') as f:
+    f.writelines(
+        f"2024-01-01 12:00:{i % 60:02d} {'ERROR' if i % 100 == 0 else 'INFO'}: request {i} handled\n"
+        for i in range(200000)
+    )
+log_mb = os.path.getsize(big_log) / 1024 / 1024
+
+start = time.time()
+generator_errors = list(process_log_file(big_log))
+generator_time = time.time() - start
+
+start = time.time()
+mmap_errors = list(scan_log(big_log, 'ERROR'))
+mmap_time = time.time() - start
+
+print(f"\nLog scan ({log_mb:.1f} MB): line generator {generator_time:.4f}s, "
+      f"mmap scanner {mmap_time:.4f}s, same matches: {generator_errors == mmap_errors}")
+
+
+# ⚡ Parallel chunked log scanning
+# Split the file into newline-aligned byte ranges, scan them in a process
+# pool, and yield results in file order. At most max_pending ranges are in
+# flight, so the reordering buffer stays bounded.
+import multiprocessing
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+def split_ranges(filename, chunk_size):
+    """(start, end) byte ranges that always end just after a newline"""
+    size = os.path.getsize(filename)
+    with open(filename, 'rb') as f:
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            yield start, end
+            start = end
+
+
+def _scan_range(filename, patterns, start, end):
+    with LogScanner(filename, *patterns) as scanner:
+        return list(scanner.lines(start, end))
+
+
+def _can_use_processes():
+    """Workers need fork (no re-import of this script) and a picklable task"""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return False
+    try:
+        pickle.dumps(_scan_range)
+    except (pickle.PicklingError, AttributeError):
+        return False  # e.g. this file was loaded via importlib, not imported
+    return True
+
+
+def scan_log_parallel(filename, *patterns, workers=None, chunk_size=1 << 20, max_pending=None):
+    """Ordered matches from a multi-process scan of newline-aligned chunks"""
+    ranges = split_ranges(filename, chunk_size)
+    if workers == 0 or not _can_use_processes():
+        for start, end in ranges:
+            yield from _scan_range(filename, patterns, start, end)
+        return
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        pending = deque()
+        for start, end in ranges:
+            pending.append(pool.submit(_scan_range, filename, patterns, start, end))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+mode = "process pool" if _can_use_processes() else "in-process fallback"
+print(f"\nThroughput on {log_mb:.1f} MB ({mode}):")
+print(f"  line generator: {log_mb / generator_time:.0f} MB/s")
+print(f"  mmap scanner: {log_mb / mmap_time:.0f} MB/s")
+for workers in sorted({1, min(4, os.cpu_count() or 1)}):
+    start = time.time()
+    parallel_errors = list(scan_log_parallel(big_log, 'ERROR', workers=workers))
+    parallel_time = time.time() - start
+    print(f"  parallel, {workers} worker(s): {log_mb / parallel_time:.0f} MB/s, "
+          f"same matches: {parallel_errors == generator_errors}")
+os.remove(big_log)
+
 
 # 🔢 Mathematical sequences with generators
 def fibonacci_generator():
@@ -86,38 +251,93 @@ fib_gen = (x for x in fibonacci_generator())
 first_10_fib = [next(fib_gen) for _ in range(10)]
 print(f"First 10 Fibonacci numbers: {first_10_fib}")
 
-# Prime number generator
-def is_prime(n):
-    if n < 2:
-        return False
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
-
-primes_gen = (x for x in range(2, 100) if is_prime(x))
+# Prime number generator (sieve once, then O(1) lookups)
+# Inline form of PrimeSieve in 08-multiple-conditions.py (snippets stay standalone)
+sieve_limit = 100
+sieve = bytearray([0, 0]) + b"\x01" * (sieve_limit - 1)  # sieve[n] == 1 <=> n is prime
+for p in range(2, int(sieve_limit**0.5) + 1):
+    if sieve[p]:
+        sieve[p * p::p] = bytes(len(range(p * p, sieve_limit + 1, p)))
+primes_gen = (x for x in range(2, 100) if sieve[x])
 primes_list = list(primes_gen)
 print(f"Prime numbers up to 100: {primes_list}")
 
 
 # 📊 Data processing pipelines
-# Simulate large dataset
-def get_user_data():
-    """Simulate fetching user data"""
-    users = [
-        {"id": i, "name": f"User{i}", "age": 20 + (i % 50), "active": i % 3 == 0}
-        for i in range(1, 100000)
-    ]
-    return users
+# Simulate large dataset - lazily, so the pipeline below never holds it all
+from array import array
+
+
+class User:
+    """Lightweight user record (__slots__: no per-instance __dict__)"""
+    __slots__ = ("id", "name", "age", "active")
+
+    def __init__(self, id, name, age, active):
+        self.id, self.name, self.age, self.active = id, name, age, active
+
+    def __repr__(self):
+        return f"User(id={self.id}, name={self.name!r}, age={self.age}, active={self.active})"
+
+
+def _mix(seed, index):
+    """SplitMix64-style hash: a reproducible random value per (seed, index)"""
+    z = (seed * 0x9E3779B97F4A7C15 + index * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return z ^ (z >> 31)
+
+
+class SyntheticUsers:
+    """Seeded user source: lazy iteration, O(1) indexing, columnar batches"""
+
+    def __init__(self, count, seed=0, start_id=1):
+        self.count, self.seed, self.start_id = count, seed, start_id
+
+    def __len__(self):
+        return self.count
+
+    def _fields(self, index):
+        # Each record depends only on (seed, index), never on earlier records
+        h = _mix(self.seed, index)
+        user_id = self.start_id + index
+        return user_id, f"User{user_id}", 20 + h % 50, (h >> 8) % 3 == 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("user index out of range")
+        return User(*self._fields(index))
+
+    def __iter__(self):
+        return (User(*self._fields(index)) for index in range(self.count))
+
+    def batches(self, size=10000):
+        """Columnar batches: dict of field -> array/list for each slice"""
+        for start in range(0, self.count, size):
+            ids, names, ages, active = array("q"), [], array("b"), bytearray()
+            for index in range(start, min(start + size, self.count)):
+                user_id, name, age, is_active = self._fields(index)
+                ids.append(user_id)
+                names.append(name)
+                ages.append(age)
+                active.append(is_active)
+            yield {"id": ids, "name": names, "age": ages, "active": active}
+
+
+def get_user_data(count=99999, seed=42):
+    """Simulate fetching user data (lazily)"""
+    return SyntheticUsers(count, seed)
 
 # Process data with generator expressions
 user_data = get_user_data()
+print(f"Reproducible random access: {user_data[50000]} == {get_user_data()[50000]}")
 
 # Memory-efficient pipeline
 active_adult_names = (
-    user["name"]
+    user.name
     for user in user_data
-    if user["active"] and user["age"] >= 25
+    if user.active and user.age >= 25
 )
 
 # Process in chunks
@@ -141,6 +361,103 @@ for chunk in process_in_chunks(active_adult_names, 500):
         break
 
 
+# 📦 Batching with islice (optionally reusing one buffer)
+from itertools import islice
+
+
+def batched(iterable, size, reuse=False, typecode=None):
+    """Yield batches of up to size items without per-item append/len calls
+
+    reuse=True refills and re-yields the same container, so a consumer must
+    finish with a batch before asking for the next one. typecode packs
+    numeric items into array.array batches (e.g. 'q' for ints, 'd' for floats).
+    """
+    if size < 1:
+        raise ValueError(f"batch size must be at least 1, got {size}")
+    return _batched(iter(iterable), size, reuse, typecode)
+
+
+def _batched(iterator, size, reuse, typecode):
+    if typecode is not None:
+        buffer = array(typecode)
+        while True:
+            if reuse:
+                del buffer[:]
+                buffer.extend(islice(iterator, size))
+            else:
+                buffer = array(typecode, islice(iterator, size))
+            if not buffer:
+                return
+            yield buffer
+    else:
+        buffer = []
+        while True:
+            if reuse:
+                buffer[:] = islice(iterator, size)
+            else:
+                buffer = list(islice(iterator, size))
+            if not buffer:
+                return
+            yield buffer
+
+
+print(f"Batches of 4: {list(map(list, batched(range(10), 4)))}")
+print(f"Typed batches: {list(batched(range(5), 2, typecode='q'))}")
+
+# Benchmark: process_in_chunks vs batched variants (consumer sums each batch)
+batch_source = range(200000)
+print("\nBatching (200,000 items): chunk | process_in_chunks | batched | reuse | typed")
+for size in (10, 100, 1000, 10000, 100000):
+    timings = []
+    for make_batches in (
+        lambda: process_in_chunks(iter(batch_source), size),
+        lambda: batched(batch_source, size),
+        lambda: batched(batch_source, size, reuse=True),
+        lambda: batched(batch_source, size, reuse=True, typecode='q'),
+    ):
+        start = time.time()
+        total = sum(sum(batch) for batch in make_batches())
+        timings.append(time.time() - start)
+    print(f"{size:>6} | " + " | ".join(f"{t:.4f}s" for t in timings))
+
+
+# Peak memory: eager list of dicts vs the lazy source, same pipeline + chunks
+import tracemalloc
+
+
+def eager_user_data(count=99999):
+    """The original eager version, kept for comparison"""
+    return [
+        {"id": i, "name": f"User{i}", "age": 20 + (i % 50), "active": i % 3 == 0}
+        for i in range(1, count + 1)
+    ]
+
+
+tracemalloc.start()
+eager_names = (u["name"] for u in eager_user_data(30000) if u["active"] and u["age"] >= 25)
+eager_chunks = sum(1 for _ in batched(eager_names, 500))
+eager_peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+
+tracemalloc.start()
+lazy_names = (u.name for u in get_user_data(30000) if u.active and u.age >= 25)
+lazy_chunks = sum(1 for _ in batched(lazy_names, 500))
+lazy_peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+
+tracemalloc.start()
+columnar_active = sum(
+    sum(1 for age, active in zip(batch["age"], batch["active"]) if active and age >= 25)
+    for batch in get_user_data(30000).batches(10000)
+)
+columnar_peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+
+print(f"\nPeak memory for 30,000 users: eager {eager_peak / 1024 / 1024:.1f} MB "
+      f"({eager_chunks} chunks), lazy {lazy_peak / 1024:.0f} KB ({lazy_chunks} chunks), "
+      f"columnar batches {columnar_peak / 1024:.0f} KB ({columnar_active:,} active adults)")
+
+
 # 🚀 Advanced generator patterns
 # Chaining generators
 def chain_generators():
@@ -239,6 +556,129 @@ api_items = good_generator_usage()
 print(f"API items: {api_items[:5]}...")  # Show first 5
 
 
+# 🌊 Async pipelines: prefetch pages concurrently, keep order, apply backpressure
+import asyncio
+
+
+class FakePaginatedAPI:
+    """Local stand-in for a paginated HTTP API with configurable latency"""
+
+    def __init__(self, total_pages=5, page_size=10, latency=0.01, fail_on=None):
+        self.total_pages = total_pages
+        self.page_size = page_size
+        self.latency = latency
+        self.fail_on = fail_on  # page number that raises, to exercise error paths
+        self.in_flight = self.max_in_flight = 0
+
+    async def fetch_page(self, page):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if page == self.fail_on:
+                raise ConnectionError(f"page {page} failed")
+            if page > self.total_pages:
+                return []
+            return [f"item_{page}_{i}" for i in range(self.page_size)]
+        finally:
+            self.in_flight -= 1
+
+
+async def paginate(fetch_page, prefetch=4):
+    """Yield pages in order, keeping up to `prefetch` requests in flight"""
+    if prefetch < 1:
+        raise ValueError(f"prefetch must be at least 1, got {prefetch}")
+    pending = deque()
+    next_page = 1
+    try:
+        while True:
+            while len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+            page = await pending.popleft()
+            if not page:
+                return
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def amap(func, source):
+    """Map stage; func may be a plain function or a coroutine function"""
+    async for item in source:
+        result = func(item)
+        yield await result if asyncio.iscoroutine(result) else result
+
+
+async def afilter(predicate, source):
+    async for item in source:
+        if predicate(item):
+            yield item
+
+
+async def aflatten(source):
+    async for items in source:
+        for item in items:
+            yield item
+
+
+async def buffered(source, maxsize=2):
+    """Bounded queue between stages: a lagging consumer pauses the producer"""
+    queue = asyncio.Queue(maxsize)
+    done = object()
+    failure = []
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put(item)  # blocks while the queue is full
+        except Exception as error:
+            failure.append(error)  # re-raised on the consumer side
+        await queue.put(done)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while (item := await queue.get()) is not done:
+            yield item
+        if failure:
+            raise failure[0]
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+async def collect(source):
+    return [item async for item in source]
+
+
+async def fetch_all_items(api, prefetch):
+    pages = buffered(paginate(api.fetch_page, prefetch), maxsize=prefetch)
+    return await collect(afilter(lambda item: not item.endswith("_9"),
+                                 amap(str.upper, aflatten(pages))))
+
+
+async_items = asyncio.run(fetch_all_items(FakePaginatedAPI(), prefetch=3))
+print(f"Async API items: {async_items[:3]}... ({len(async_items)} total)")
+
+try:
+    asyncio.run(fetch_all_items(FakePaginatedAPI(fail_on=3), prefetch=2))
+except ConnectionError as error:
+    print(f"Upstream error reached the consumer: {error}")
+
+print("\nAsync pagination throughput (20 pages, 10 ms latency):")
+for prefetch in (1, 2, 4, 8):
+    api = FakePaginatedAPI(total_pages=20, latency=0.01)
+    start = time.time()
+    items = asyncio.run(fetch_all_items(api, prefetch))
+    elapsed = time.time() - start
+    print(f"  prefetch={prefetch}: {len(items) / elapsed:,.0f} items/s, "
+          f"max concurrent requests: {api.max_in_flight}")
+
+
 # 💡 When to use:
 # - Processing large datasets
 # - Memory-constrained environments
@@ -4,8 +4,13 @@ Comprehension with Functions - Apply custom logic elegantly
 🎯 Problem: Use functions within comprehensions for complex transformations
 """
 
+import functools
 import math
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 
@@ -33,10 +38,11 @@ print(f"Processed: {result}")
 
 
 # 🎯 Real-world example: Data validation and transformation
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def validate_email(email):
     """Simple email validation"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_PATTERN.match(email) is not None
 
 def normalize_email(email):
     """Normalize email address"""
@@ -61,12 +67,141 @@ valid_emails = [
 print(f"Valid emails: {valid_emails}")
 
 
+# ✉️ Batch email validation: strip once, cheap rejects before the regex
+def validate_many(emails):
+    """Return normalized valid emails in a single pass"""
+    match = EMAIL_PATTERN.match
+    valid = []
+    for email in emails:
+        email = email.strip()
+        # The pattern only accepts ASCII with an '@', so skip the regex otherwise
+        if email.isascii() and '@' in email and match(email):
+            valid.append(email.lower())
+    return valid
+
+print(f"Valid emails (batch): {validate_many(user_emails)}")
+
+# Benchmark against the comprehension (200k-email mix of good and bad)
+signups = [
+    "  Alice@Company.COM  ", "bob@invalid", "charlie@example.org",
+    "invalid-email", "zoë@example.com", "eve@test.net", "a@@b.com", "dan@corp.io"
+] * 25000
+
+def validate_email_uncompiled(email):
+    """The original validator: re.match with a raw pattern string per call"""
+    return re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email) is not None
+
+start = time.time()
+original_valid = [
+    normalize_email(email)
+    for email in signups
+    if validate_email_uncompiled(email.strip())
+]
+original_time = time.time() - start
+
+start = time.time()
+comprehension_valid = [
+    normalize_email(email)
+    for email in signups
+    if validate_email(email.strip())
+]
+comprehension_time = time.time() - start
+
+start = time.time()
+batch_valid = validate_many(signups)
+batch_time = time.time() - start
+
+print(f"Email validation ({len(signups):,} emails): original {original_time:.4f}s, "
+      f"precompiled comprehension {comprehension_time:.4f}s, validate_many {batch_time:.4f}s")
+print(f"Same result: {original_valid == comprehension_valid == batch_valid}")
+
+
+# 🧠 Memoizing expensive pure helpers
+# Comprehensions often call the same helper in the filter and the output
+# expression. A small LRU cache makes the second call free.
+_memoized_functions = []
+_KWARGS_MARK = object()  # keeps f(1, x=2) and f(1, ("x", 2)) apart
+
+def memoize(maxsize=128, maxbytes=None, ttl=None):
+    """Thread-safe LRU memoization bounded by entries and/or result bytes
+
+    Every caller gets the same cached object, so memoized functions should
+    return immutable values (tuples, not lists).
+    """
+    def decorator(func):
+        cache = OrderedDict()  # key -> (result, nbytes, cost_seconds, expires_at)
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "time_saved": 0.0, "bytes": 0}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    if entry[3] is None or entry[3] > time.monotonic():
+                        cache.move_to_end(key)
+                        stats["hits"] += 1
+                        stats["time_saved"] += entry[2]
+                        return entry[0]
+                    del cache[key]  # expired
+                    stats["bytes"] -= entry[1]
+            # Compute outside the lock so slow calls don't serialize threads
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            cost = time.perf_counter() - start
+            nbytes = sys.getsizeof(result) if maxbytes is not None else 0
+            with lock:
+                stats["misses"] += 1
+                previous = cache.pop(key, None)
+                if previous is not None:
+                    stats["bytes"] -= previous[1]
+                cache[key] = (result, nbytes, cost, time.monotonic() + ttl if ttl else None)
+                stats["bytes"] += nbytes
+                while cache and (
+                    (maxsize is not None and len(cache) > maxsize)
+                    or (maxbytes is not None and stats["bytes"] > maxbytes)
+                ):
+                    _, evicted = cache.popitem(last=False)
+                    stats["bytes"] -= evicted[1]
+                    stats["evictions"] += 1
+            return result
+
+        def cache_stats():
+            with lock:
+                return dict(stats, size=len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0, evictions=0, time_saved=0.0, bytes=0)
+
+        wrapper.cache_stats = cache_stats
+        wrapper.cache_clear = cache_clear
+        _memoized_functions.append(wrapper)
+        return wrapper
+    return decorator
+
+def cache_report():
+    """Memoized functions ranked by the time their caches saved"""
+    ranked = sorted(
+        ((func.__name__, func.cache_stats()) for func in _memoized_functions),
+        key=lambda item: item[1]["time_saved"],
+        reverse=True
+    )
+    for name, stats in ranked:
+        print(f"  {name}: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['evictions']} evictions, saved {stats['time_saved'] * 1e6:.0f}µs")
+    return ranked
+
+
 # 🔢 Mathematical functions in comprehensions
 def is_perfect_square(n):
     """Check if number is a perfect square"""
     sqrt_n = int(math.sqrt(n))
     return sqrt_n * sqrt_n == n
 
+@memoize(maxsize=1024)
 def prime_factors(n):
     """Get prime factors of a number"""
     factors = []
@@ -78,7 +213,7 @@ def prime_factors(n):
         d += 1
     if n > 1:
         factors.append(n)
-    return factors
+    return tuple(factors)  # shared by every cache hit, so immutable
 
 numbers = range(1, 26)
 
@@ -105,9 +240,10 @@ def word_count(text):
     """Count words in text"""
     return len(clean_text(text).split())
 
+@memoize(maxbytes=64 * 1024)
 def extract_hashtags(text):
     """Extract hashtags from text"""
-    return re.findall(r'#\w+', text)
+    return tuple(re.findall(r'#\w+', text))
 
 # Process social media posts
 posts = [
@@ -132,6 +268,7 @@ print(f"Posts with hashtags: {posts_with_tags}")
 
 
 # 📊 Data transformation functions
+@memoize(maxsize=4096, ttl=60)  # ages change at midnight
 def calculate_age(birth_date):
     """Calculate age from birth date"""
     today = datetime.now()
@@ -172,6 +309,71 @@ employee_profiles = [
 ]
 print(f"Employee profiles: {employee_profiles}")
 
+print("Cache report (helpers called twice per item above):")
+cache_report()
+
+
+# 📅 Batch ages for large HR exports
+# Take "today" once and encode dates as yyyymmdd integers: the age is then
+# just (today - birth) // 10000, with no per-record tuple comparisons.
+# Categories come from a table with one label per distinct age.
+from bisect import bisect_right
+
+AGE_THRESHOLDS = [18, 65]
+AGE_LABELS = ["Minor", "Adult", "Senior"]  # same buckets as categorize_age
+
+def date_key(date):
+    return date.year * 10000 + date.month * 100 + date.day
+
+def batch_age_profiles(records, today=None):
+    """Columnar names, ages and age categories for many records at once"""
+    today_key = date_key(today or datetime.now())
+    ages = [(today_key - date_key(record["birth_date"])) // 10000 for record in records]
+    low = min(ages, default=0)
+    labels = [AGE_LABELS[bisect_right(AGE_THRESHOLDS, age)]
+              for age in range(low, max(ages, default=0) + 1)]
+    return {
+        "name": [record["name"] for record in records],
+        "age": ages,
+        "category": [labels[age - low] for age in ages],
+    }
+
+batch_profiles = batch_age_profiles(employees)
+print(f"Batch ages: {batch_profiles['age']}, categories: {batch_profiles['category']}")
+
+# Benchmark against the per-record comprehension, with the cache bypassed:
+# hr_export has only ~1,700 distinct birth dates, so memoized calls would be
+# measuring cache hits rather than the age math
+uncached_age = calculate_age.__wrapped__
+hr_export = [
+    {"name": f"Emp{i}", "birth_date": datetime(1940 + i % 80, 1 + i % 12, 1 + i % 28)}
+    for i in range(100000)
+]
+
+start = time.time()
+comprehension_profiles = [
+    {
+        "name": emp["name"],
+        "age": uncached_age(emp["birth_date"]),
+        "category": categorize_age(uncached_age(emp["birth_date"]))
+    }
+    for emp in hr_export
+]
+comprehension_time = time.time() - start
+
+start = time.time()
+columnar_profiles = batch_age_profiles(hr_export)
+batch_time = time.time() - start
+
+matches = all(
+    profile["age"] == age and profile["category"] == category
+    for profile, age, category in zip(
+        comprehension_profiles, columnar_profiles["age"], columnar_profiles["category"]
+    )
+)
+print(f"Ages for {len(hr_export):,} employees: comprehension {comprehension_time:.4f}s, "
+      f"batch {batch_time:.4f}s, results match: {matches}")
+
 
 # 🚀 Advanced function patterns
 def apply_discount(price, discount_percent):
@@ -214,6 +416,63 @@ final_prices = [
 print(f"Final prices: {final_prices}")
 
 
+# 🧾 Staged pricing: each intermediate value is computed once
+class PricingEngine:
+    """Column-oriented discount -> tax -> format stages with cached results"""
+
+    def __init__(self, products, tax_rate):
+        self.names = [product["name"] for product in products]
+        self.prices = [product["price"] for product in products]
+        self.discounts = [product["discount"] for product in products]
+        self._tax_rate = tax_rate
+        self._discounted = None
+        self._taxed = None
+        self.stage_runs = {"discount": 0, "tax": 0}
+
+    @property
+    def discounted(self):
+        if self._discounted is None:
+            self._discounted = list(map(apply_discount, self.prices, self.discounts))
+            self.stage_runs["discount"] += 1
+        return self._discounted
+
+    @property
+    def taxed(self):
+        if self._taxed is None:
+            rate = self._tax_rate
+            self._taxed = [calculate_tax(price, rate) for price in self.discounted]
+            self.stage_runs["tax"] += 1
+        return self._taxed
+
+    def set_tax_rate(self, tax_rate):
+        """Repricing for a new tax rate keeps the discount stage"""
+        self._tax_rate = tax_rate
+        self._taxed = None
+
+    def set_discounts(self, discounts):
+        self.discounts = list(discounts)
+        self._discounted = self._taxed = None
+
+    def rows(self):
+        """Formatting happens here, only for rows that are actually output"""
+        for name, price, discounted, taxed in zip(
+            self.names, self.prices, self.discounted, self.taxed
+        ):
+            yield {
+                "name": format_product_name(name),
+                "original_price": format_currency(price),
+                "discounted_price": format_currency(discounted),
+                "final_price": format_currency(taxed)
+            }
+
+
+pricing = PricingEngine(products, tax_rate=8)
+print(f"Engine matches comprehension: {list(pricing.rows()) == final_prices}")
+pricing.set_tax_rate(10)
+print(f"Repriced at 10% tax: {[row['final_price'] for row in pricing.rows()]}")
+print(f"Stage runs: {pricing.stage_runs}")  # discount ran once, tax twice
+
+
 # 🎨 Combining multiple functions
 def process_text_pipeline(text):
     """Text processing pipeline"""
@@ -228,11 +487,8 @@ def is_valid_product(product):
         len(product.get("name", "")) > 2
     )
 
-def enhance_product(product):
-    """Enhance product with computed fields"""
-    if not is_valid_product(product):
-        return None
-    
+def build_enhanced_product(product):
+    """Computed fields for a product already known to be valid"""
     return {
         "name": process_text_pipeline(product["name"]),
         "price": product["price"],
@@ -240,6 +496,13 @@ def enhance_product(product):
         "sku": f"SKU_{product['name'][:3].upper()}_{product['price']}"
     }
 
+def enhance_product(product):
+    """Enhance product with computed fields"""
+    if not is_valid_product(product):
+        return None
+    
+    return build_enhanced_product(product)
+
 # Process raw product data
 raw_products = [
     {"name": "wireless_mouse", "price": 30},
@@ -258,6 +521,45 @@ enhanced_products = [
 print(f"Enhanced products: {enhanced_products}")
 
 
+# ⏭️ Transform-or-skip: validate and transform each record exactly once
+SKIP = object()  # sentinel: unlike None, it can never be a real result
+
+stage_stats = {}
+
+def timed(stage):
+    """Accumulate call counts and elapsed time per pipeline stage"""
+    def decorator(func):
+        counters = stage_stats.setdefault(stage, {"calls": 0, "seconds": 0.0})
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counters["calls"] += 1
+                counters["seconds"] += time.perf_counter() - start
+        return wrapper
+    return decorator
+
+timed_validation = timed("validation")(is_valid_product)
+timed_transformation = timed("transformation")(build_enhanced_product)
+
+def enhance_or_skip(product):
+    """Return the enhanced product, or SKIP if it fails validation"""
+    if not timed_validation(product):
+        return SKIP
+    return timed_transformation(product)
+
+def transform_all(mapper, items):
+    """Comprehension-like helper: map once, drop SKIP results"""
+    return [result for result in map(mapper, items) if result is not SKIP]
+
+single_pass_products = transform_all(enhance_or_skip, raw_products)
+print(f"Single-pass enhanced products match: {single_pass_products == enhanced_products}")
+print(f"Stage counters: {stage_stats}")  # validation ran once per product
+
+
 # 🔍 Custom sorting and filtering functions
 def sort_key_function(item):
     """Custom sort key"""
@@ -289,6 +591,57 @@ important_tasks = sorted(
 print(f"Important tasks: {important_tasks}")
 
 
+# 🏆 Top-k selection without a full sort
+import heapq
+import random
+
+def top_k(iterable, k, key=None, predicate=None):
+    """Same as sorted(filter(predicate, it), key=key, reverse=True)[:k]
+
+    Keeps a k-sized min-heap of (key, -position, item) entries, so it runs
+    in O(n log k) time and O(k) memory. Each key is computed exactly once.
+    """
+    if k <= 0:
+        return []
+    heap = []
+    for position, item in enumerate(iterable):
+        if predicate is not None and not predicate(item):
+            continue
+        entry = (key(item) if key else item, -position, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:  # only beat-the-worst items touch the heap
+            heapq.heapreplace(heap, entry)
+    heap.sort(reverse=True)
+    return [item for _, _, item in heap]
+
+top_tasks = top_k(tasks, 3, key=sort_key_function, predicate=filter_by_criteria)
+print(f"Top 3 tasks: {[task['name'] for task in top_tasks]}, "
+      f"matches sorted: {top_tasks == important_tasks[:3]}")
+
+# Benchmark against filter + sorted() - the heap wins while k is small next to n
+rng = random.Random(7)
+many_tasks = [
+    {"name": f"task_{i}", "priority": rng.randint(1, 1000), "status": rng.choice(["active", "inactive"])}
+    for i in range(200000)
+]
+print(f"Top-k over {len(many_tasks):,} tasks:")
+for k in (10, 1000, 100000):
+    start = time.time()
+    sorted_top = sorted(
+        [task for task in many_tasks if filter_by_criteria(task)],
+        key=sort_key_function,
+        reverse=True
+    )[:k]
+    sorted_time = time.time() - start
+
+    start = time.time()
+    heap_top = top_k(many_tasks, k, key=sort_key_function, predicate=filter_by_criteria)
+    heap_time = time.time() - start
+    print(f"  k={k}: sorted {sorted_time:.4f}s, top_k {heap_time:.4f}s, "
+          f"same: {sorted_top == heap_top}")
+
+
 # 💡 When to use:
 # - Complex data transformations
 # - Validation and filtering
@@ -4,6 +4,9 @@ Multiple Conditions - Complex filtering with logical operators
 🎯 Problem: Apply multiple criteria for sophisticated data filtering
 """
 
+import math
+from itertools import compress, islice
+
 
 def complex_filter_traditional(data):
     """Traditional approach with multiple conditions"""
@@ -91,19 +94,252 @@ best_deals = [
 print(f"Best deals: {[p['name'] for p in best_deals]}")
 
 
+# 🧭 Selectivity-aware condition ordering
+# An `and` chain is cheapest when conditions that are cheap and likely to fail
+# run first. Written order rarely matches that, and the best order can change
+# as the data drifts, so the set measures its conditions and re-plans.
+import time
+
+class ConditionSet:
+    """AND-chain of predicates ordered by sampled cost and pass rate"""
+
+    def __init__(self, conditions, sample_size=256, replan_every=10000):
+        if not isinstance(conditions, dict):
+            # Keyed by position too: every lambda is named '<lambda>'
+            conditions = {
+                f"{index}:{condition.__name__}": condition
+                for index, condition in enumerate(conditions)
+            }
+        self.conditions = dict(conditions)
+        self.sample_size = sample_size
+        self.replan_every = replan_every
+        self.order = list(self.conditions)  # written order until the first plan
+        self.estimates = {}  # name -> (pass_rate, seconds per call)
+        self.stats = {name: {"evaluated": 0, "passed": 0} for name in self.conditions}
+        self.items_seen = 0
+        self.matched = 0
+        self.plans = 0
+        self.history = []  # (items_seen, order) each time the order changed
+        self._sample = []  # items collected by __call__ for the next plan
+
+    @staticmethod
+    def _rank(pass_rate, cost):
+        # Expected cost per rejected item - lowest rank goes first
+        return cost / (1 - pass_rate) if pass_rate < 1 else math.inf
+
+    def replan(self, sample):
+        """Measure every condition on the sample and reorder the chain"""
+        if not sample:
+            return self.order
+        for name, predicate in self.conditions.items():
+            start = time.perf_counter()
+            passed = sum(1 for item in sample if predicate(item))
+            cost = (time.perf_counter() - start) / len(sample)
+            self.estimates[name] = (passed / len(sample), cost)
+        order = sorted(self.conditions, key=lambda name: self._rank(*self.estimates[name]))
+        self.plans += 1
+        if order != self.order or not self.history:
+            self.history.append((self.items_seen, tuple(order)))
+        self.order = order
+        return order
+
+    def __call__(self, item):
+        """Check one item; as a comprehension predicate it samples the first
+        sample_size items of every replan_every and re-plans like filter()"""
+        if self.items_seen % self.replan_every < self.sample_size:
+            self._sample.append(item)
+            if len(self._sample) == self.sample_size:
+                self.replan(self._sample)
+                self._sample = []
+        self.items_seen += 1
+        for name in self.order:
+            counters = self.stats[name]
+            counters["evaluated"] += 1
+            if not self.conditions[name](item):
+                return False
+            counters["passed"] += 1
+        self.matched += 1
+        return True
+
+    def filter(self, iterable):
+        """Yield matching items, re-planning on a sample of every block"""
+        iterator = iter(iterable)
+        while True:
+            block = list(islice(iterator, self.replan_every))
+            if not block:
+                return
+            self.replan(block[:self.sample_size])
+            # One pass per condition over the survivors: the same short-circuit
+            # work as an `and` chain, with evaluation counts for free
+            survivors = block
+            for name in self.order:
+                predicate = self.conditions[name]
+                counters = self.stats[name]
+                counters["evaluated"] += len(survivors)
+                survivors = [item for item in survivors if predicate(item)]
+                counters["passed"] += len(survivors)
+            self.items_seen += len(block)
+            self.matched += len(survivors)
+            yield from survivors
+
+    def explain(self):
+        """Human-readable plan: order, estimates and running counters"""
+        lines = [f"ConditionSet: {self.matched:,}/{self.items_seen:,} matched, {self.plans} plans"]
+        for position, name in enumerate(self.order, 1):
+            pass_rate, cost = self.estimates.get(name, (math.nan, math.nan))
+            counters = self.stats[name]
+            lines.append(
+                f"  {position}. {name}: pass {pass_rate:.0%}, {cost * 1e9:.0f} ns/call, "
+                f"evaluated {counters['evaluated']:,}, passed {counters['passed']:,}"
+            )
+        return "\n".join(lines)
+
+
+# Same rules as complex_filter_comprehension and premium_products
+student_rules = ConditionSet({
+    "adult": lambda s: s["age"] >= 18,
+    "high_score": lambda s: s["score"] >= 80,
+    "active": lambda s: s["active"] == True,
+    "long_name": lambda s: len(s["name"]) > 3,
+})
+planned_students = list(student_rules.filter(students))
+print(f"Planned filter matches comprehension: {planned_students == qualified}")
+
+premium_rules = ConditionSet({
+    "over_100": lambda p: p["price"] > 100,
+    "rated": lambda p: p["rating"] >= 4.0,
+    "in_stock": in_stock,
+    "featured": is_featured,
+})
+print(f"Planned premium products: {[p['name'] for p in premium_rules.filter(products)]}")
+
+between_rules = ConditionSet([lambda n: n > 1, lambda n: n < 5])
+print(f"Unnamed conditions: {list(between_rules.filter(range(10)))}, keys: {list(between_rules.conditions)}")
+
+# Reviews where the written order is poor, and the data drifts halfway through
+reviews = [
+    {
+        "id": i,
+        "text": f"Review {i}: " + "the screen, keyboard and BATTERY life are covered at length. " * 8,
+        "rating": (1 if i % 20 else 5) if i >= 100000 else (1 if i % 5 == 0 else 4),
+        "verified": (i % 20 == 0) if i >= 100000 else (i % 2 == 0),
+    }
+    for i in range(200000)
+]
+
+start = time.time()
+written_order = [
+    review for review in reviews
+    if ("battery" in review["text"].lower() and
+        review["verified"] and
+        review["rating"] <= 2)
+]
+written_time = time.time() - start
+
+review_rules = ConditionSet({
+    "mentions_battery": lambda r: "battery" in r["text"].lower(),
+    "verified": lambda r: r["verified"],
+    "low_rating": lambda r: r["rating"] <= 2,
+})
+start = time.time()
+planned = list(review_rules.filter(reviews))
+planned_time = time.time() - start
+
+print(f"\nCondition ordering ({len(reviews):,} reviews, drift at 100,000):")
+print(f"Written order: {written_time:.4f}s, {len(written_order)} items")
+print(f"Planned order: {planned_time:.4f}s, {len(planned)} items, same: {planned == written_order}")
+print(review_rules.explain())
+for items_seen, order in review_rules.history:
+    print(f"  from item {items_seen:,}: {' -> '.join(order)}")
+
+# The same set used directly as a comprehension predicate - it adapts too,
+# but per-item counting costs more than filter()'s one pass per condition
+predicate_rules = ConditionSet(review_rules.conditions)
+start = time.time()
+predicate_planned = [review for review in reviews if predicate_rules(review)]
+predicate_time = time.time() - start
+print(f"As a predicate: {predicate_time:.4f}s, {len(predicate_planned)} items, "
+      f"same: {predicate_planned == written_order}")
+print(predicate_rules.explain())
+del reviews, written_order, planned, predicate_planned
+
+
 # 🔢 Numeric range conditions
 def is_in_range(value, min_val, max_val):
     """Check if value is in range"""
     return min_val <= value <= max_val
 
-def is_prime(n):
-    """Check if number is prime"""
-    if n < 2:
-        return False
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
+class PrimeSieve:
+    """Prime lookups backed by a growable Sieve of Eratosthenes bitmap"""
+
+    # Deterministic Miller-Rabin witnesses for n < 3.3 * 10**24
+    WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+    def __init__(self, limit=1000, segment_size=1 << 15):
+        self.segment_size = segment_size
+        self.bits = bytearray(2)  # bits[n] == 1 <=> n is prime (0 and 1 are not)
+        self.grow(limit)
+
+    @property
+    def limit(self):
+        return len(self.bits) - 1
+
+    def grow(self, limit):
+        """Extend the sieve to cover [0, limit], one segment at a time"""
+        if limit <= self.limit:
+            return
+        root = math.isqrt(limit)
+        if root > self.limit:
+            self.grow(root)  # base primes must be final before sieving past them
+        bits = self.bits
+        low = len(bits)
+        bits.extend(b"\x01" * (limit + 1 - low))
+        base_primes = list(compress(range(root + 1), bits[:root + 1]))
+        for seg_low in range(low, limit + 1, self.segment_size):
+            seg_high = min(seg_low + self.segment_size, limit + 1)
+            for p in base_primes:
+                if p * p >= seg_high:
+                    break
+                start = max(p * p, (seg_low + p - 1) // p * p)
+                bits[start:seg_high:p] = bytes(len(range(start, seg_high, p)))
+
+    def _miller_rabin(self, n):
+        d, r = n - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            r += 1
+        for a in self.WITNESSES:
+            x = pow(a, d, n)
+            if x in (1, n - 1):
+                continue
+            for _ in range(r - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+    def is_prime(self, n):
+        """O(1) below the sieve bound, Miller-Rabin above it"""
+        if n <= self.limit:
+            return n >= 0 and self.bits[n] == 1
+        if any(n % p == 0 for p in self.WITNESSES):
+            return n in self.WITNESSES
+        return self._miller_rabin(n)
+
+    __contains__ = is_prime
+
+    def primes_in_range(self, start, stop):
+        """Yield primes in [start, stop), growing the sieve as needed"""
+        self.grow(stop - 1)
+        start = max(start, 2)
+        return compress(range(start, stop), self.bits[start:stop])
+
+
+# One shared service: every prime check below is a bitmap lookup
+primes = PrimeSieve(limit=1000)
+is_prime = primes.is_prime
 
 numbers = range(1, 101)
 
@@ -119,12 +355,16 @@ print(f"Special numbers: {special_numbers}")
 
 # Prime numbers in specific ranges
 categorized_primes = {
-    "small": [n for n in numbers if is_prime(n) and n < 20],
-    "medium": [n for n in numbers if is_prime(n) and 20 <= n < 50],
-    "large": [n for n in numbers if is_prime(n) and n >= 50]
+    "small": list(primes.primes_in_range(numbers.start, 20)),
+    "medium": list(primes.primes_in_range(20, 50)),
+    "large": list(primes.primes_in_range(50, numbers.stop))
 }
 print(f"Categorized primes: {categorized_primes}")
 
+# Beyond the sieve bound the same call falls back to Miller-Rabin
+print(f"Is 2**61 - 1 prime? {2**61 - 1 in primes}")
+print(f"Primes just above 10,000: {list(primes.primes_in_range(10000, 10050))}")
+
 
 # 🎨 String-based conditions
 def contains_vowels(text):
@@ -212,6 +452,183 @@ important_events = [
 print(f"Important events: {[e['name'] for e in important_events]}")
 
 
+# 🗓️ Time-range index for calendar filters
+# Sorting once by time turns date ranges into two bisections, and storing
+# weekday / day / hour / business-hours flags as byte arrays lets calendar
+# predicates run as C-level translate() and compress() calls instead of a
+# weekday() call per item.
+import operator
+from array import array
+from bisect import bisect_left, bisect_right
+
+from datetime import timezone
+
+_EPOCH = datetime(1, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _flag_table(allowed):
+    """translate() table mapping each allowed byte value to 1, others to 0"""
+    allowed = set(allowed)
+    return bytes(value in allowed for value in range(256))
+
+
+class TimeIndex:
+    """Items kept sorted by time with precomputed calendar columns"""
+
+    def __init__(self, items=(), key="date"):
+        self.key = key  # field holding the datetime, or None for bare datetimes
+        self.stamps = array("q")  # microseconds since 0001-01-01
+        self.weekdays = bytearray()
+        self.days = bytearray()
+        self.hours = bytearray()
+        self.business = bytearray()  # weekday and within business hours
+        self.items = []
+        self.aware = None  # fixed by the first datetime seen
+        for item in sorted(items, key=lambda item: self._stamp(self._moment(item))):
+            self._append(item)
+
+    def _moment(self, item):
+        return item if self.key is None else item[self.key]
+
+    def _stamp(self, moment):
+        """Microseconds since 0001-01-01; aware datetimes are taken in UTC"""
+        aware = moment.utcoffset() is not None
+        if self.aware is None:
+            self.aware = aware
+        elif aware != self.aware:
+            raise TypeError("cannot mix naive and timezone-aware datetimes in one TimeIndex")
+        if aware:
+            moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+        return (moment - _EPOCH) // _MICROSECOND
+
+    def _columns(self, moment):
+        # Calendar columns use each datetime's own wall clock (local business hours)
+        return (
+            self._stamp(moment),
+            moment.weekday(),
+            moment.day,
+            moment.hour,
+            not is_weekend(moment) and is_business_hours(moment.hour),
+        )
+
+    def _append(self, item):
+        stamp, weekday, day, hour, business = self._columns(self._moment(item))
+        self.stamps.append(stamp)
+        self.weekdays.append(weekday)
+        self.days.append(day)
+        self.hours.append(hour)
+        self.business.append(business)
+        self.items.append(item)
+
+    def insert(self, item):
+        """Add one item, keeping time order (appends are the fast path)"""
+        stamp, weekday, day, hour, business = self._columns(self._moment(item))
+        position = bisect_right(self.stamps, stamp)
+        if position == len(self.items):
+            self._append(item)
+            return
+        self.stamps.insert(position, stamp)
+        self.weekdays.insert(position, weekday)
+        self.days.insert(position, day)
+        self.hours.insert(position, hour)
+        self.business.insert(position, business)
+        self.items.insert(position, item)
+
+    def __len__(self):
+        return len(self.items)
+
+    def span(self, start=None, end=None):
+        """Positions [lo, hi) of items with start <= time < end"""
+        lo = 0 if start is None else bisect_left(self.stamps, self._stamp(start))
+        hi = len(self.items) if end is None else bisect_left(self.stamps, self._stamp(end))
+        return lo, max(lo, hi)
+
+    def scan(self, start=None, end=None, weekdays=None, days=None, hours=None,
+             business_hours=None, where=None):
+        """Items in [start, end) matching every given calendar filter"""
+        lo, hi = self.span(start, end)
+        flags = None
+        for column, allowed in (
+            (self.weekdays, weekdays),
+            (self.days, days),
+            (self.hours, hours),
+            (self.business, None if business_hours is None else [business_hours]),
+        ):
+            if allowed is None:
+                continue
+            column_flags = column[lo:hi].translate(_flag_table(allowed))
+            flags = column_flags if flags is None else bytes(map(operator.and_, flags, column_flags))
+        selected = self.items[lo:hi] if flags is None else compress(self.items[lo:hi], flags)
+        if where is not None:
+            selected = filter(where, selected)
+        return list(selected)
+
+
+# business_weekdays and important_events as index scans
+date_index = TimeIndex(dates, key=None)
+indexed_weekdays = date_index.scan(weekdays=range(4), days=range(2, 32, 2))
+print(f"Indexed business weekdays: {len(indexed_weekdays)} dates, same: {indexed_weekdays == business_weekdays}")
+
+event_index = TimeIndex(events)
+indexed_events = event_index.scan(business_hours=True,
+                                  where=lambda event: event["priority"] in ["high", "medium"])
+print(f"Indexed important events: {[e['name'] for e in indexed_events]}")
+
+event_index.insert({"name": "Standup", "date": datetime(2024, 1, 16, 9, 0), "priority": "high"})
+january_16 = event_index.scan(datetime(2024, 1, 16), datetime(2024, 1, 17))
+print(f"Events on Jan 16 after insert: {[e['name'] for e in january_16]}")
+
+# Timezone-aware events: ranges compare in UTC, calendar flags use local time
+new_york = timezone(timedelta(hours=-5))
+remote_events = TimeIndex([
+    {"name": "NY standup", "date": datetime(2024, 1, 15, 9, 30, tzinfo=new_york)},
+    {"name": "UTC sync", "date": datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)},
+])
+before_1pm_utc = remote_events.scan(end=datetime(2024, 1, 15, 13, 0, tzinfo=timezone.utc))
+print(f"Before 13:00 UTC: {[e['name'] for e in before_1pm_utc]}, "
+      f"in local business hours: {[e['name'] for e in remote_events.scan(business_hours=True)]}")
+
+# Benchmark: one week of business-hours events out of a year of them
+schedule = [
+    {"name": f"Event{i}", "date": base_date + timedelta(minutes=7 * i),
+     "priority": ("high", "medium", "low")[i % 3]}
+    for i in range(300000)
+]
+week_start, week_end = datetime(2025, 3, 3), datetime(2025, 3, 10)
+
+start = time.time()
+scanned = [
+    event for event in schedule
+    if (week_start <= event["date"] < week_end and
+        not is_weekend(event["date"]) and
+        is_business_hours(event["date"].hour))
+]
+scan_time = time.time() - start
+
+start = time.time()
+schedule_index = TimeIndex(schedule)
+build_time = time.time() - start
+
+start = time.time()
+indexed = schedule_index.scan(week_start, week_end, business_hours=True)
+index_time = time.time() - start
+
+start = time.time()
+calendar_scan = [event for event in schedule if event["date"].weekday() < 4 and event["date"].day % 2 == 0]
+calendar_scan_time = time.time() - start
+
+start = time.time()
+calendar_indexed = schedule_index.scan(weekdays=range(4), days=range(2, 32, 2))
+calendar_index_time = time.time() - start
+
+print(f"\nTime index ({len(schedule):,} events, one-off build {build_time:.4f}s):")
+print(f"  one-week business hours: scan {scan_time:.4f}s, index {index_time:.6f}s, "
+      f"same: {scanned == indexed}")
+print(f"  Mon-Thu on even days: scan {calendar_scan_time:.4f}s, index {calendar_index_time:.4f}s, "
+      f"same: {calendar_scan == calendar_indexed}")
+del schedule, schedule_index
+
+
 # 🚀 Advanced conditional patterns
 def satisfies_all_conditions(item, conditions):
     """Check if item satisfies all conditions"""
@@ -248,6 +665,84 @@ bargain_products = [
 print(f"Bargain products: {[p['name'] for p in bargain_products]}")
 
 
+# ⚙️ Compiled condition lists
+# all()/any() over a generator pays for a generator frame plus one Python
+# call per condition per item. compile_conditions() generates one function
+# instead: (field, op, value) tuples are inlined as plain comparisons, other
+# callables are called directly, and `and`/`or` keep the short-circuit order.
+_COMPARISONS = {">", ">=", "<", "<=", "==", "!=", "in", "not in"}
+
+def compile_conditions(conditions, mode="all"):
+    """Build item -> bool from callables and (field, op, value[, default]) tuples"""
+    if mode not in ("all", "any"):
+        raise ValueError(f"mode must be 'all' or 'any', not {mode!r}")
+    namespace = {}
+    terms = []
+    for index, condition in enumerate(conditions):
+        if callable(condition):
+            namespace[f"_c{index}"] = condition
+            terms.append(f"_c{index}(item)")
+            continue
+        field, op, value, *default = condition
+        if op not in _COMPARISONS:
+            raise ValueError(f"Unsupported comparison {op!r} for field {field!r}")
+        namespace[f"_v{index}"] = value
+        if default:
+            namespace[f"_d{index}"] = default[0]
+            lookup = f"item.get({field!r}, _d{index})"
+        else:
+            lookup = f"item[{field!r}]"
+        terms.append(f"({lookup} {op} _v{index})")
+    joiner = " and " if mode == "all" else " or "
+    body = joiner.join(terms) or ("True" if mode == "all" else "False")
+    source = f"def _check(item):\n    return bool({body})"
+    exec(source, namespace)
+    check = namespace["_check"]
+    check.source = source
+    return check
+
+# Inline equivalents of high_end_conditions and bargain_conditions
+high_end_rules = [("price", ">", 500), ("rating", ">=", 4.5)]
+bargain_rules = [("discount", ">", 0, 0), ("price", "<", 200)]
+
+is_high_end = compile_conditions(high_end_rules, mode="all")
+is_bargain = compile_conditions(bargain_rules, mode="any")
+print(f"Compiled high-end check:\n{is_high_end.source}")
+print(f"Compiled high-end products: {[p['name'] for p in products if is_high_end(p)]}")
+print(f"Compiled bargain products: {[p['name'] for p in products if is_bargain(p)]}")
+
+# Plain callables compile too - same functions, no generator per item
+is_high_end_calls = compile_conditions(high_end_conditions, mode="all")
+is_bargain_calls = compile_conditions(bargain_conditions, mode="any")
+
+many_products = [
+    {"name": f"Product{i}", "price": (i * 37) % 1500, "rating": 3.0 + (i % 21) / 10,
+     **({"discount": i % 30} if i % 3 else {})}
+    for i in range(300000)
+]
+print(f"\nCompiled conditions ({len(many_products):,} products):")
+for label, conditions, generic, calls, inlined in (
+    ("high-end (all)", high_end_conditions, satisfies_all_conditions, is_high_end_calls, is_high_end),
+    ("bargain (any)", bargain_conditions, satisfies_any_condition, is_bargain_calls, is_bargain),
+):
+    start = time.time()
+    generic_result = [p for p in many_products if generic(p, conditions)]
+    generic_time = time.time() - start
+
+    start = time.time()
+    calls_result = [p for p in many_products if calls(p)]
+    calls_time = time.time() - start
+
+    start = time.time()
+    inlined_result = [p for p in many_products if inlined(p)]
+    inlined_time = time.time() - start
+
+    print(f"  {label}: generator {generic_time:.4f}s, compiled calls {calls_time:.4f}s, "
+          f"inlined {inlined_time:.4f}s ({generic_time / inlined_time:.1f}x), "
+          f"same: {generic_result == calls_result == inlined_result}")
+del many_products
+
+
 # 🎯 Conditional transformations
 def categorize_student(student):
     """Categorize student based on multiple criteria"""
@@ -305,6 +800,266 @@ print(f"Simple condition: {simple_time:.4f}s, {len(simple_result)} items")
 print(f"Multiple conditions: {complex_time:.4f}s, {len(complex_result)} items")
 
 
+# 🧮 Column-store filtering with boolean masks
+# Each field lives in one contiguous array and every comparison produces a
+# mask over all rows at once. Masks combine with & / | / ~ and matching rows
+# are only gathered at the very end. NumPy is used when it is installed,
+# otherwise masks are int bitmaps built by C-level map() calls.
+# Without NumPy this mode only saves memory: every mask scans all rows, so it
+# runs 2-4x slower than the short-circuiting dict comprehension.
+# Python cannot overload `and`, `or` or `in`, so conditions are written with
+# &, |, ~, .isin() and .truthy() instead of the comprehension syntax.
+import sys
+from functools import partial
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Flag bytes <-> binary digits, as _pack_flags in 04-set-comprehensions.py
+_FLAG_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class Mask:
+    """Row selection over a ColumnStore (bit i of the bitmap <=> row i)"""
+
+    __slots__ = ("bits", "size")
+
+    def __init__(self, bits, size):
+        self.bits = bits  # int bitmap, or a NumPy bool array
+        self.size = size
+
+    @classmethod
+    def from_flags(cls, flags, size):
+        """bytes of 0/1 flags -> mask (row 0 is the most significant bit)"""
+        if np is not None:
+            return cls(np.frombuffer(flags, dtype=bool), size)
+        return cls(int(flags.translate(_FLAG_DIGITS) or b"0", 2), size)
+
+    def __and__(self, other):
+        return Mask(self.bits & other.bits, self.size)
+
+    def __or__(self, other):
+        return Mask(self.bits | other.bits, self.size)
+
+    def __invert__(self):
+        if not isinstance(self.bits, int):
+            return Mask(~self.bits, self.size)
+        return Mask(self.bits ^ ((1 << self.size) - 1), self.size)
+
+    def count(self):
+        """Number of selected rows"""
+        if not isinstance(self.bits, int):
+            return int(np.count_nonzero(self.bits))
+        return self.bits.bit_count()
+
+    def indices(self):
+        """Selected row numbers in ascending order"""
+        if not isinstance(self.bits, int):
+            return np.flatnonzero(self.bits).tolist()
+        flags = format(self.bits, f"0{self.size}b").encode().translate(_DIGIT_FLAGS)
+        return list(compress(range(self.size), flags))
+
+
+class Column:
+    """One field of a ColumnStore; comparisons return a Mask"""
+
+    __slots__ = ("values",)
+    __hash__ = None
+
+    def __init__(self, values):
+        self.values = values
+
+    def _vectorized(self):
+        return np is not None and isinstance(self.values, np.ndarray)
+
+    def _mask(self, numpy_op, op, other):
+        if self._vectorized():
+            return Mask(numpy_op(self.values, other), len(self.values))
+        # other <op> value, evaluated per element without a Python-level loop
+        return Mask.from_flags(bytes(map(partial(op, other), self.values)), len(self.values))
+
+    def __gt__(self, other):
+        return self._mask(operator.gt, operator.lt, other)
+
+    def __ge__(self, other):
+        return self._mask(operator.ge, operator.le, other)
+
+    def __lt__(self, other):
+        return self._mask(operator.lt, operator.gt, other)
+
+    def __le__(self, other):
+        return self._mask(operator.le, operator.ge, other)
+
+    def __eq__(self, other):
+        return self._mask(operator.eq, operator.eq, other)
+
+    def __ne__(self, other):
+        return self._mask(operator.ne, operator.ne, other)
+
+    def __mod__(self, divisor):
+        if self._vectorized():
+            return Column(self.values % divisor)
+        return Column(list(map(operator.mod, self.values, repeat(divisor))))
+
+    def isin(self, choices):
+        """Mask of rows whose value is one of choices"""
+        if self._vectorized():
+            return Mask(np.isin(self.values, list(choices)), len(self.values))
+        return Mask.from_flags(bytes(map(frozenset(choices).__contains__, self.values)),
+                               len(self.values))
+
+    def truthy(self):
+        """Mask of rows whose value is true (e.g. boolean fields)"""
+        if self._vectorized():
+            return Mask(self.values.astype(bool), len(self.values))
+        return Mask.from_flags(bytes(map(operator.truth, self.values)), len(self.values))
+
+
+def _column_buffer(values):
+    """Most compact buffer for a column -> (buffer, decoder for gathered values)
+
+    Only single-type columns are packed, so gathered values keep their type:
+    bools become 0/1 bytes (decoded back with bool), ints and floats become
+    int64/float64 buffers, and anything else - mixed types, ints that do
+    not fit in 64 bits, strings - stays a plain list.
+    """
+    kinds = set(map(type, values))
+    if kinds == {bool}:
+        if np is not None:
+            return np.array(values, dtype=bool), None
+        return bytearray(values), bool
+    typecode = {frozenset([int]): "q", frozenset([float]): "d"}.get(frozenset(kinds))
+    if typecode is not None:
+        try:
+            if np is not None:
+                return np.array(values, dtype=np.int64 if typecode == "q" else np.float64), None
+            return array(typecode, values), None
+        except OverflowError:
+            pass
+    return list(values), None
+
+
+class ColumnStore:
+    """Records stored as one array per field, filtered with masks"""
+
+    def __init__(self, columns):
+        self.columns, self.decoders = {}, {}
+        for name, values in columns.items():
+            self.columns[name], decoder = _column_buffer(list(values))
+            if decoder is not None:
+                self.decoders[name] = decoder
+        self.size = len(next(iter(self.columns.values()), ()))
+
+    @classmethod
+    def from_records(cls, records, fields=None):
+        """Transpose a list of dicts into columns"""
+        fields = fields or (list(records[0]) if records else [])
+        return cls({field: [record[field] for record in records] for field in fields})
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, field):
+        return Column(self.columns[field])
+
+    def where(self, condition):
+        """condition(store) -> Mask, e.g. lambda row: (row["value"] > 10) & ..."""
+        return condition(self)
+
+    def gather(self, mask, fields=None):
+        """Rebuild only the selected rows as dicts"""
+        fields = fields or list(self.columns)
+        rows = mask.indices()
+        columns = []
+        for field in fields:
+            column = self.columns[field]
+            if np is not None and isinstance(column, np.ndarray):
+                values = column[rows].tolist()  # back to plain Python scalars
+            else:
+                values = [column[i] for i in rows]
+            if field in self.decoders:
+                values = list(map(self.decoders[field], values))
+            columns.append(values)
+        return [dict(zip(fields, values)) for values in zip(*columns)]
+
+    def nbytes(self):
+        """Approximate memory held by the column buffers"""
+        return sum(
+            sys.getsizeof(column) + sum(map(sys.getsizeof, column)) if isinstance(column, list)
+            else memoryview(column).nbytes
+            for column in self.columns.values()
+        )
+
+
+def dict_rows_nbytes(records):
+    """Approximate memory held by a list of flat dicts"""
+    return sys.getsizeof(records) + sum(
+        sys.getsizeof(record) + sum(map(sys.getsizeof, record.values()))
+        for record in records
+    )
+
+
+# Same conditions as the comprehensions above. Note the parentheses:
+# & and | bind tighter than comparison operators.
+complex_condition = lambda row: (
+    (row["value"] > 50000) &
+    row["category"].isin([1, 2, 3]) &
+    row["active"].truthy() &
+    (row["id"] % 10 == 0)
+)
+
+store = ColumnStore.from_records(large_dataset)
+print(f"\nColumn store ({'NumPy' if np is not None else 'int bitmap'} masks):")
+print(f"Simple mask matches: {store.gather(store.where(lambda row: row['value'] > 50000)) == simple_result}")
+print(f"Complex mask matches: {store.gather(store.where(complex_condition)) == complex_result}")
+mixed_store = ColumnStore.from_records([
+    {"id": 1, "w": 1, "active": True, "big": 2**70},
+    {"id": 2, "w": 2.5, "active": False, "big": 3},
+])
+print(f"Gathered rows keep their types: {mixed_store.gather(mixed_store['id'] >= 1)}")
+
+for size in (100000, 400000):
+    rows = large_dataset if size == len(large_dataset) else [
+        {"id": i, "value": i, "category": i % 5, "active": i % 2 == 0}
+        for i in range(size)
+    ]
+    threshold = size // 2
+    start = time.time()
+    dict_matches = [
+        item for item in rows
+        if (item["value"] > threshold and
+            item["category"] in [1, 2, 3] and
+            item["active"] and
+            item["id"] % 10 == 0)
+    ]
+    dict_time = time.time() - start
+
+    start = time.time()
+    column_store = ColumnStore.from_records(rows)
+    build_time = time.time() - start
+
+    start = time.time()
+    mask = column_store.where(lambda row: (
+        (row["value"] > threshold) &
+        row["category"].isin([1, 2, 3]) &
+        row["active"].truthy() &
+        (row["id"] % 10 == 0)
+    ))
+    column_matches = column_store.gather(mask)
+    column_time = time.time() - start
+
+    print(f"  {size:,} rows: dicts {dict_time:.4f}s, masks {column_time:.4f}s "
+          f"(dict/mask time ratio {dict_time / column_time:.2f}, one-off build {build_time:.4f}s), "
+          f"same: {dict_matches == column_matches}")
+    print(f"    memory: dicts {dict_rows_nbytes(rows) / 1024 / 1024:.1f} MB, "
+          f"columns {column_store.nbytes() / 1024 / 1024:.1f} MB")
+    del rows, column_store
+
+
 # 💡 When to use:
 # - Complex data filtering
 # - Business rule implementation
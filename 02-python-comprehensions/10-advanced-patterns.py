@@ -47,6 +47,88 @@ advanced_pattern_examples()
 
 
 # 🎯 Real-world example: Complex data processing
+# Single-pass grouping: every record is visited once, no matter how many groups
+_AGGREGATORS = {
+    # op: (initial state, update(state, value), finalize(state))
+    'count': (lambda: 0, lambda state, value: state + 1, lambda state: state),
+    'sum': (lambda: 0, lambda state, value: state + value, lambda state: state),
+    'min': (lambda: None, lambda state, value: value if state is None or value < state else state,
+            lambda state: state),
+    'max': (lambda: None, lambda state, value: value if state is None or value > state else state,
+            lambda state: state),
+    'mean': (lambda: (0, 0), lambda state, value: (state[0] + value, state[1] + 1),
+             lambda state: state[0] / state[1] if state[1] else None),
+    'list': (list, lambda state, value: state.append(value) or state, lambda state: state),
+}
+
+
+def _field_getter(field):
+    """Turn a field name (or callable) into a record -> value function"""
+    if callable(field):
+        return field
+    return lambda record: record[field]
+
+
+class GroupByReducer:
+    """Streaming group-by: feed records one at a time, read nested results"""
+
+    def __init__(self, keys, aggregations):
+        self.keys = [_field_getter(key) for key in keys]
+        # A bare (op, field) tuple produces plain values instead of dicts
+        self.single = isinstance(aggregations, tuple)
+        specs = {'value': aggregations} if self.single else aggregations
+        for name, (op, _) in specs.items():
+            if op not in _AGGREGATORS:
+                raise ValueError(f"Unknown aggregation {op!r} for {name!r}; "
+                                 f"supported: {', '.join(_AGGREGATORS)}")
+        self.specs = [
+            (name, _AGGREGATORS[op], _field_getter(field) if field is not None else None)
+            for name, (op, field) in specs.items()
+        ]
+        self.groups = {}
+
+    def add(self, record):
+        """Fold one record into its group"""
+        group_key = tuple(key(record) for key in self.keys)
+        states = self.groups.get(group_key)
+        if states is None:
+            states = self.groups[group_key] = [init() for _, (init, _, _), _ in self.specs]
+        for index, (_, (_, update, _), getter) in enumerate(self.specs):
+            states[index] = update(states[index], getter(record) if getter else None)
+
+    def update(self, records):
+        """Fold an iterable (or generator) of records"""
+        for record in records:
+            self.add(record)
+        return self
+
+    def _finalize(self, states):
+        aggregated = {
+            name: finalize(state)
+            for (name, (_, _, finalize), _), state in zip(self.specs, states)
+        }
+        return aggregated['value'] if self.single else aggregated
+
+    def result(self):
+        """Nested dict keyed by each grouping level (no keys: one aggregate)"""
+        if not self.keys:
+            states = self.groups.get(()) or [init() for _, (init, _, _), _ in self.specs]
+            return self._finalize(states)
+        output = {}
+        for group_key, states in self.groups.items():
+            value = self._finalize(states)
+            level = output
+            for key in group_key[:-1]:
+                level = level.setdefault(key, {})
+            level[group_key[-1]] = value
+        return output
+
+
+def group_by(records, keys, aggregations):
+    """One-pass multi-key group-by with count/sum/min/max/mean/list"""
+    return GroupByReducer(keys, aggregations).update(records).result()
+
+
 def process_sales_data():
     """Process complex sales data with advanced patterns"""
     sales_data = [
@@ -57,28 +139,79 @@ def process_sales_data():
         {'rep': 'Bob', 'region': 'South', 'product': 'B', 'qty': 200, 'price': 15.0},
     ]
     
-    # Pattern: Grouped aggregation using comprehensions
-    rep_totals = {
-        rep: sum(sale['qty'] * sale['price'] for sale in sales_data if sale['rep'] == rep)
-        for rep in {sale['rep'] for sale in sales_data}
-    }
+    # Pattern: Grouped aggregation in a single pass
+    rep_totals = group_by(
+        sales_data,
+        keys=['rep'],
+        aggregations=('sum', lambda sale: sale['qty'] * sale['price'])
+    )
     print(f"Sales rep totals: {rep_totals}")
     
     # Pattern: Nested grouping
-    region_product_summary = {
-        region: {
-            product: sum(sale['qty'] for sale in sales_data 
-                        if sale['region'] == region and sale['product'] == product)
-            for product in {sale['product'] for sale in sales_data if sale['region'] == region}
-        }
-        for region in {sale['region'] for sale in sales_data}
-    }
+    region_product_summary = group_by(
+        sales_data, keys=['region', 'product'], aggregations=('sum', 'qty')
+    )
     print(f"Region-product summary: {region_product_summary}")
+    
+    # Pattern: Several aggregations at once
+    rep_stats = group_by(sales_data, keys=['rep'], aggregations={
+        'orders': ('count', None),
+        'units': ('sum', 'qty'),
+        'min_price': ('min', 'price'),
+        'max_price': ('max', 'price'),
+        'avg_qty': ('mean', 'qty'),
+        'products': ('list', 'product'),
+    })
+    print(f"Sales rep stats: {rep_stats}")
+
+    # Pattern: No keys - one aggregate over everything
+    overall = group_by(sales_data, keys=[], aggregations={
+        'orders': ('count', None),
+        'units': ('sum', 'qty'),
+    })
+    print(f"Overall: {overall}")
 
 
 process_sales_data()
 
 
+def group_by_benchmark():
+    """Compare repeated-scan grouping with the single-pass group_by"""
+    import random
+    import time
+    
+    rng = random.Random(42)
+    reps = [f"Rep{i}" for i in range(100)]
+    # Streaming source: records are generated, never stored as a list
+    def sales_stream(n):
+        for _ in range(n):
+            yield {'rep': rng.choice(reps), 'qty': rng.randint(1, 100), 'price': 10.0}
+    
+    sales = list(sales_stream(20000))
+    
+    start = time.time()
+    rescanned = {
+        rep: sum(sale['qty'] for sale in sales if sale['rep'] == rep)
+        for rep in {sale['rep'] for sale in sales}
+    }
+    rescan_time = time.time() - start
+    
+    start = time.time()
+    single_pass = group_by(sales, keys=['rep'], aggregations=('sum', 'qty'))
+    single_time = time.time() - start
+    
+    streamed = GroupByReducer(['rep'], ('count', None)).update(sales_stream(20000)).result()
+    
+    print(f"\nGroup-by performance ({len(sales):,} records, {len(reps)} groups):")
+    print(f"Repeated scans: {rescan_time:.4f}s")
+    print(f"Single pass: {single_time:.4f}s")
+    print(f"Results equal: {rescanned == single_pass}")
+    print(f"Streamed records counted: {sum(streamed.values()):,}")
+
+
+group_by_benchmark()
+
+
 # 🔢 Mathematical and scientific patterns
 def mathematical_patterns():
     """Advanced mathematical computations using comprehensions"""